@@ -7,22 +7,75 @@ CLI for the DataMender data cleaning tool.
 import argparse
 import sys
 import os
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.data_processor import DataProcessor, DataMenderError
-from src.data_cleaner import DataCleaner, CleaningConfig
+# The data modules are imported where they are first needed, so --help and
+# --gui start without loading them
+if TYPE_CHECKING:
+    from src.data_processor import DataProcessor
+    from src.data_cleaner import DataCleaner, CleaningConfig
+
+
+def csv_delimiter(value: str) -> str:
+    """Parse the --delimiter argument, accepting \\t for a tab."""
+    if value == "\\t":
+        return "\t"
+    if len(value) != 1:
+        raise argparse.ArgumentTypeError("delimiter must be a single character")
+    return value
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a count argument where 0 turns the feature off."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError("must not be negative")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """Parse a count argument that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
 
 
 class DataMenderCLI:
     """Command-line interface for DataMender."""
     
+    __slots__ = ("_processor", "_cleaner")
+    
     def __init__(self):
-        self.processor = DataProcessor()
-        self.cleaner = DataCleaner()
+        self._processor = None
+        self._cleaner = None
+    
+    @property
+    def processor(self) -> "DataProcessor":
+        """Data processor, created on first use."""
+        if self._processor is None:
+            from src.data_processor import DataProcessor
+            self._processor = DataProcessor()
+        return self._processor
+    
+    @property
+    def cleaner(self) -> "DataCleaner":
+        """Data cleaner, created on first use."""
+        if self._cleaner is None:
+            from src.data_cleaner import DataCleaner
+            self._cleaner = DataCleaner()
+        return self._cleaner
     
     def create_parser(self) -> argparse.ArgumentParser:
         """Create command-line argument parser."""
@@ -40,16 +93,25 @@ Examples:
         # Input/Output
         parser.add_argument('input_file', nargs='?', help='Input CSV or JSON file')
         parser.add_argument('-o', '--output', help='Output file path')
+        parser.add_argument('--output-format', choices=['csv', 'json', 'parquet', 'arrow'],
+                          help='Output file format (default: taken from the output file extension; '
+                               'parquet and arrow need pyarrow)')
+        parser.add_argument('--delimiter', type=csv_delimiter, metavar='CHAR',
+                          help='CSV input delimiter, e.g. ";" or "\\t" (default: detect from the file)')
         
         # Preview and analysis
         parser.add_argument('--preview', action='store_true', 
                           help='Preview changes before applying')
+        parser.add_argument('--preview-rows', type=positive_int, default=5, metavar='N',
+                          help='Number of rows shown by --preview (default: 5)')
         parser.add_argument('--analyze-only', action='store_true',
                           help='Only analyze data and show issues report')
         
         # Cleaning operations
         parser.add_argument('--remove-duplicates', action='store_true',
                           help='Remove duplicate rows')
+        parser.add_argument('--dedup-subset', type=str, default="", metavar='COL[,COL...]',
+                          help='Compare only these columns when removing duplicates')
         parser.add_argument('--trim-whitespace', action='store_true',
                           help='Remove leading/trailing whitespace')
         parser.add_argument('--fill-missing', action='store_true',
@@ -74,6 +136,11 @@ Examples:
                           help='Verbose output')
         parser.add_argument('--quiet', '-q', action='store_true',
                           help='Quiet mode (minimal output)')
+        parser.add_argument('--batch-size', type=non_negative_int, default=0, metavar='N',
+                          help='Stream the input in batches of N rows instead of loading it all '
+                               '(the issues report is shown after processing)')
+        parser.add_argument('--workers', type=positive_int, default=1, metavar='N',
+                          help='Clean columns in N parallel processes (pays off on large files)')
         
         return parser
     
@@ -95,6 +162,9 @@ Examples:
             if not parsed_args.quiet:
                 print(f"Error: {e}")
             return 1
+        finally:
+            if self._cleaner is not None:
+                self._cleaner.close()
     
     def launch_gui(self) -> int:
         """Launch the GUI interface."""
@@ -126,12 +196,21 @@ Examples:
             print(f"Error: Input file '{args.input_file}' not found.")
             return 1
         
+        if args.dedup_subset and not args.remove_duplicates:
+            print("Error: --dedup-subset requires --remove-duplicates.")
+            return 1
+        
+        from src.data_processor import DataMenderError
+        
+        if args.batch_size > 0:
+            return self.run_streaming(args)
+        
         # Load data
         if not args.quiet:
             print(f"Loading data from {args.input_file}...")
         
         try:
-            data = self.processor.load_data(args.input_file)
+            data = self.processor.load_data(args.input_file, args.delimiter)
             if not args.quiet:
                 print(f"Loaded {len(data)} rows with {len(data[0].keys()) if data else 0} columns.")
         except DataMenderError as e:
@@ -142,35 +221,49 @@ Examples:
         if not args.quiet:
             print("\nAnalyzing data for issues...")
         
-        issues_report = self.processor.detect_issues(data)
-        self.display_issues_report(issues_report, args.quiet)
-        
         if args.analyze_only:
+            issues_report = self.processor.detect_issues(data)
+            self.display_issues_report(issues_report, args.quiet)
             return 0
         
         # Create cleaning configuration
-        config = self.create_cleaning_config(args)
+        try:
+            config = self.create_cleaning_config(args, data)
+        except DataMenderError as e:
+            print(f"Error: {e}")
+            return 1
         
-        # Preview changes if requested
         if args.preview:
-            if not self.preview_changes(data, config, args.quiet):
+            # Only the preview sample is cleaned before the prompt, as its
+            # own batch so its rows are reused in the result; the rest is
+            # cleaned once the changes are accepted
+            issues_report = self.processor.detect_issues(data)
+            self.display_issues_report(issues_report, args.quiet)
+            
+            sample_size = min(args.preview_rows, len(data))
+            self.cleaner.reset()
+            cleaned_sample = self.cleaner.clean_batch(data[:sample_size], config)
+            if not self.preview_changes(data, config, args.quiet, args.preview_rows, cleaned_sample):
                 print("Operation cancelled.")
                 return 0
-        
-        # Clean data
-        if not args.quiet:
-            print("\nCleaning data...")
-        
-        cleaned_data = self.cleaner.clean_data(data, config)
+            
+            if not args.quiet:
+                print("\nCleaning data...")
+            cleaned_data = cleaned_sample + self.cleaner.clean_batch(data[sample_size:], config)
+        else:
+            # Analyze and clean in one pass over the columns
+            if not args.quiet:
+                print("\nCleaning data...")
+            cleaned_data, issues_report = self.cleaner.clean_and_report(data, config)
+            self.display_issues_report(issues_report, args.quiet)
         
         # Show cleaning statistics
         if not args.quiet:
-            stats = self.cleaner.get_cleaning_stats()
-            self.display_cleaning_stats(stats)
+            self.display_cleaning_stats(self.cleaner.get_cleaning_stats())
         
         # Save cleaned data
         try:
-            self.processor.save_data(args.output, cleaned_data)
+            self.processor.save_data(args.output, cleaned_data, args.output_format)
             if not args.quiet:
                 print(f"\nCleaned data saved to {args.output}")
                 print(f"Processed {len(cleaned_data)} rows successfully.")
@@ -180,12 +273,93 @@ Examples:
         
         return 0
     
-    def create_cleaning_config(self, args) -> CleaningConfig:
-        """Create cleaning configuration from CLI arguments."""
+    def run_streaming(self, args) -> int:
+        """Run command-line workflow in a single pass over batches of rows."""
+        from src.data_processor import DataMenderError, IssueDetector
+        
+        if not args.quiet:
+            print(f"Streaming data from {args.input_file} in batches of {args.batch_size} rows...")
+        
+        try:
+            batches = self.processor.iter_batches(args.input_file, args.batch_size, args.delimiter)
+            first_batch = next(batches, [])
+        except DataMenderError as e:
+            print(f"Error loading data: {e}")
+            return 1
+        
+        detector = IssueDetector()
+        config = None
+        cleaned_sample = []
+        sample_size = 0
+        self.cleaner.reset()
+        
+        if not args.analyze_only:
+            try:
+                config = self.create_cleaning_config(args, first_batch)
+            except DataMenderError as e:
+                print(f"Error: {e}")
+                return 1
+            
+            # Preview changes if requested
+            if args.preview:
+                # The cleaned sample is written out first instead of being cleaned again
+                sample_size = min(args.preview_rows, len(first_batch))
+                cleaned_sample = self.cleaner.clean_batch(first_batch[:sample_size], config, detector)
+                if not self.preview_changes(first_batch, config, args.quiet, args.preview_rows, cleaned_sample):
+                    print("Operation cancelled.")
+                    return 0
+            
+            if not args.quiet:
+                print("\nCleaning data...")
+        
+        def cleaned_batches():
+            yield cleaned_sample
+            for batch in chain([first_batch[sample_size:]], batches):
+                yield self.cleaner.clean_batch(batch, config, detector)
+        
+        # Batches are written to a partial file next to the output, which
+        # replaces the output only once every batch has been cleaned
+        output = Path(args.output)
+        partial = output.with_name(f".partial-{output.name}")
+        try:
+            if args.analyze_only:
+                for batch in chain([first_batch], batches):
+                    detector.update(batch)
+            else:
+                self.processor.save_batches(str(partial), cleaned_batches(), args.output_format)
+                os.replace(partial, output)
+        except DataMenderError as e:
+            print(f"Error processing data: {e}")
+            return 1
+        finally:
+            if partial.exists():
+                partial.unlink()
+        
+        self.display_issues_report(detector.report(), args.quiet)
+        
+        if args.analyze_only:
+            return 0
+        
+        stats = self.cleaner.get_cleaning_stats()
+        if not args.quiet:
+            self.display_cleaning_stats(stats)
+            print(f"\nCleaned data saved to {args.output}")
+            print(f"Processed {stats.get('final_rows', 0)} rows successfully.")
+        
+        return 0
+    
+    def create_cleaning_config(self, args, data: Optional[list] = None) -> "CleaningConfig":
+        """Create cleaning configuration from CLI arguments.
+        
+        Raises DataMenderError if --dedup-subset names a column the data lacks.
+        """
+        from src.data_cleaner import CleaningConfig
+        
         fill_defaults = {"_default": args.fill_default} if args.fill_missing else {}
         
         config = CleaningConfig(
             remove_duplicates=args.remove_duplicates,
+            dedup_subset=[name.strip() for name in args.dedup_subset.split(',') if name.strip()],
             trim_whitespace=args.trim_whitespace,
             fill_missing=args.fill_missing,
             fill_defaults=fill_defaults,
@@ -193,12 +367,19 @@ Examples:
             date_format=args.date_format,
             normalize_case=args.normalize_case,
             case_type=args.case_type,
-            rename_columns=args.auto_rename_columns
+            rename_columns=args.auto_rename_columns,
+            workers=args.workers
         )
         
+        if data is None:
+            data = self.processor.data
+        
+        if config.dedup_subset and data:
+            self.cleaner.check_dedup_subset(config.dedup_subset, chain.from_iterable(data))
+        
         if args.auto_rename_columns:
             # Get automatic column rename suggestions
-            suggestions = self.cleaner.auto_suggest_column_renames(self.processor.data)
+            suggestions = self.cleaner.auto_suggest_column_renames(data)
             config.column_mapping = suggestions
         
         return config
@@ -291,19 +472,24 @@ Examples:
         if stats.get('columns_removed', 0) > 0:
             print(f"Columns removed: {stats['columns_removed']}")
     
-    def preview_changes(self, original_data: list, config: CleaningConfig, quiet: bool = False) -> bool:
-        """Preview cleaning changes and get user confirmation."""
+    def preview_changes(self, original_data: list, config: "CleaningConfig", quiet: bool = False,
+                        rows: int = 5, cleaned_sample: Optional[list] = None) -> bool:
+        """Preview cleaning changes and get user confirmation.
+        
+        cleaned_sample, if given, is the already cleaned first rows of original_data.
+        """
         if not original_data:
             return True
         
         # Apply cleaning to a sample
-        sample_size = min(5, len(original_data))
+        sample_size = min(rows, len(original_data))
         sample_data = original_data[:sample_size]
-        cleaned_sample = self.cleaner.clean_data(sample_data, config)
+        if cleaned_sample is None:
+            cleaned_sample = self.cleaner.clean_data(sample_data, config)
         
         if not quiet:
             print("\n" + "="*50)
-            print("PREVIEW - First 5 rows")
+            print(f"PREVIEW - First {rows} rows")
             print("="*50)
             
             print("\nBEFORE:")
@@ -331,27 +517,30 @@ Examples:
             print("(No data)")
             return
         
+        from src.table_utils import rows_to_columns
+        
         # Get column names
         columns = list(data[0].keys())
         
-        # Calculate column widths
-        col_widths = {}
-        for col in columns:
-            col_widths[col] = max(
-                len(col),
-                max(len(str(row.get(col, ""))) for row in data[:3])  # Check first 3 rows
-            )
-            col_widths[col] = min(col_widths[col], 20)  # Limit width
+        # Pull each column's values out once instead of looking them up per cell
+        cells = {col: list(map(str, values)) for col, values in rows_to_columns(data, columns).items()}
+        
+        # Calculate column widths from the first 3 rows
+        col_widths = {
+            col: min(max(len(col), *map(len, cells[col][:3])), 20)  # Limit width
+            for col in columns
+        }
         
         # Print header
-        header = " | ".join(col.ljust(col_widths[col]) for col in columns)
+        header = " | ".join(f"{col:<{col_widths[col]}}" for col in columns)
         print(header)
         print("-" * len(header))
         
         # Print rows
-        for row in data:
+        for i in range(len(data)):
+            # Pad and truncate in one format spec
             row_str = " | ".join(
-                str(row.get(col, "")).ljust(col_widths[col])[:col_widths[col]] 
+                f"{cells[col][i]:<{col_widths[col]}.{col_widths[col]}}"
                 for col in columns
             )
             print(row_str)
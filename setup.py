@@ -32,6 +32,31 @@ def install_dependencies():
         return False
 
 
+def build_extensions():
+    """Compile optional Cython accelerators in place."""
+    try:
+        from Cython.Build import cythonize
+        from setuptools.dist import Distribution
+    except ImportError:
+        print("Cython not installed; using pure-Python date parsing")
+        return True
+    
+    print("Compiling optional extensions...")
+    try:
+        dist = Distribution({
+            "ext_modules": cythonize(["src/_fastdates.pyx"], quiet=True),
+            "package_dir": {"": "src"},
+        })
+        build_ext = dist.get_command_obj("build_ext")
+        build_ext.inplace = True
+        dist.run_command("build_ext")
+        print("✓ Compiled src/_fastdates")
+    except Exception as e:
+        # A missing compiler only costs speed
+        print(f"Warning: could not compile extensions ({e}); using pure-Python date parsing")
+    return True
+
+
 def create_executable_script():
     """Create executable script for DataMender."""
     script_content = f'''#!/usr/bin/env python3
@@ -132,6 +157,9 @@ def main():
     if not install_dependencies():
         return 1
     
+    # Compile optional extensions
+    build_extensions()
+    
     # Create executable script
     if not create_executable_script():
         return 1
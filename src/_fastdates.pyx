@@ -0,0 +1,126 @@
+# cython: language_level=3, boundscheck=False
+"""
+DataMender - Compiled Date Standardization
+Optional Cython version of the per-column date loop in data_cleaner.
+String work is compiled here rather than with Numba, which only handles str in object mode.
+"""
+
+cdef int[13] _DAYS_IN_MONTH = [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+
+cdef inline int _days_in_month(int year, int month):
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+cdef inline int _read_number(str text, Py_ssize_t start, Py_ssize_t end):
+    """Parse text[start:end] as ASCII digits."""
+    cdef int number = 0
+    cdef Py_ssize_t k
+    for k in range(start, end):
+        number = number * 10 + (<int>text[k] - 48)
+    return number
+
+
+cdef object _parse_date(str text, int target):
+    """Return the reformatted date, text if it is not a valid date, or None to defer."""
+    cdef Py_ssize_t length = len(text)
+    cdef Py_ssize_t first = -1, second = -1, k
+    cdef Py_UCS4 char, separator = 0
+    cdef int year, month, day
+    cdef Py_ssize_t len1, len2, len3
+
+    for k in range(length):
+        char = text[k]
+        if u'0' <= char <= u'9':
+            continue
+        if char != u'-' and char != u'/' and char != u'.':
+            # Non-ASCII digits still match the regex patterns
+            return None
+        if separator == 0:
+            separator = char
+            first = k
+        elif char != separator or second != -1:
+            return text
+        else:
+            second = k
+
+    if second == -1:
+        return text
+
+    len1 = first
+    len2 = second - first - 1
+    len3 = length - second - 1
+    if not 1 <= len2 <= 2:
+        return text
+
+    if len1 == 4 and 1 <= len3 <= 2 and (separator == u'-' or separator == u'/'):
+        # YYYY-MM-DD and YYYY/MM/DD
+        year = _read_number(text, 0, first)
+        month = _read_number(text, first + 1, second)
+        day = _read_number(text, second + 1, length)
+    elif 1 <= len1 <= 2 and len3 == 4:
+        year = _read_number(text, second + 1, length)
+        if separator == u'/':
+            # MM/DD/YYYY
+            month = _read_number(text, 0, first)
+            day = _read_number(text, first + 1, second)
+        else:
+            # DD-MM-YYYY and DD.MM.YYYY
+            day = _read_number(text, 0, first)
+            month = _read_number(text, first + 1, second)
+    elif 1 <= len1 <= 2 and len3 == 2 and separator == u'/':
+        # MM/DD/YY, with the same century pivot as strptime
+        year = _read_number(text, second + 1, length)
+        year += 2000 if year < 69 else 1900
+        month = _read_number(text, 0, first)
+        day = _read_number(text, first + 1, second)
+    else:
+        return text
+
+    if year < 1000:
+        # strftime pads small years differently across platforms
+        return None
+    if not 1 <= month <= 12 or not 1 <= day <= _days_in_month(year, month):
+        return text
+
+    if target == 1:
+        return "%02d/%02d/%04d" % (month, day, year)
+    if target == 2:
+        return "%02d/%02d/%04d" % (day, month, year)
+    return "%04d-%02d-%02d" % (year, month, day)
+
+
+cpdef int standardize_date_column(list values, str target_format, object convert):
+    """Standardize the dates in one column in place and return how many changed."""
+    cdef Py_ssize_t i
+    cdef int changed = 0
+    cdef int target
+    cdef str stripped
+    cdef object value, result
+
+    target_format = target_format.upper()
+    target = 1 if target_format == "US" else 2 if target_format == "EU" else 0
+
+    for i in range(len(values)):
+        value = values[i]
+        if not isinstance(value, str):
+            continue
+
+        stripped = value.strip()
+        if not stripped:
+            continue
+
+        if 6 <= len(stripped) <= 10 and stripped[0].isdigit() and stripped[-1].isdigit():
+            result = _parse_date(stripped, target)
+            if result is None:
+                result = convert(stripped)
+        else:
+            result = stripped
+
+        if result != value:
+            values[i] = result
+            changed += 1
+
+    return changed
@@ -4,17 +4,32 @@ DataMender - Data Cleaning Operations
 Implementation of various data cleaning and standardization operations.
 """
 
-import re
 import copy
+import re
+import sys
+from collections import Counter
+from itertools import compress, repeat
+from operator import add, eq, ne
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from functools import partial
+from typing import List, Dict, Any, Optional, Union, Callable, Tuple, Iterable
 from dataclasses import dataclass
 
+try:
+    from .data_processor import DataMenderError, IssueDetector
+except ImportError:
+    from data_processor import DataMenderError, IssueDetector
+
 
-@dataclass
+# Slotted dataclasses need Python 3.10; older versions keep a per-instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CleaningConfig:
     """Configuration for data cleaning operations."""
     remove_duplicates: bool = False
+    dedup_subset: Optional[List[str]] = None  # Columns compared when removing duplicates
     standardize_dates: bool = False
     date_format: str = "ISO"  # ISO, US, EU
     fill_missing: bool = False
@@ -25,6 +40,7 @@ class CleaningConfig:
     column_mapping: Optional[Dict[str, str]] = None
     trim_whitespace: bool = False
     filter_columns: Optional[List[str]] = None
+    workers: int = 1  # Processes used for per-column operations
     
     def __post_init__(self):
         if self.fill_defaults is None:
@@ -33,6 +49,219 @@ class CleaningConfig:
             self.column_mapping = {}
         if self.filter_columns is None:
             self.filter_columns = []
+        if self.dedup_subset is None:
+            self.dedup_subset = []
+    
+    def compile(self) -> Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """Return a function that cleans whole datasets with this configuration.
+        
+        The function works on a snapshot of the config, so later changes to
+        this one do not affect it, and reuses a single DataCleaner whose
+        statistics describe the most recent call. With workers configured,
+        call clean.cleaner.close() when done to stop its worker processes.
+        """
+        config = copy.deepcopy(self)
+        cleaner = DataCleaner()
+        
+        def clean(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return cleaner.clean_data(data, config)
+        
+        clean.cleaner = cleaner
+        return clean
+
+
+class _Absent:
+    """Placeholder for keys missing from a row."""
+    
+    def __reduce__(self):
+        # Unpickle to the module-level instance so identity checks still hold
+        return "_ABSENT"
+
+
+_ABSENT = _Absent()
+
+# Value-level steps that run before and after duplicate removal
+_STEPS_BEFORE_DEDUP = ("trim_whitespace",)
+_STEPS_AFTER_DEDUP = ("fill_missing", "standardize_dates", "normalize_case")
+
+# Batches smaller than this are cleaned in-process even when workers are
+# configured, as sending their columns to other processes costs more than
+# the steps save
+_PARALLEL_MIN_ROWS = 20000
+
+# Common date patterns, with the (year, month, day) group of each
+_DATE_PATTERNS = [
+    (re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$'), '%Y-%m-%d', (1, 2, 3)),  # YYYY-MM-DD
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$'), '%m/%d/%Y', (3, 1, 2)),  # MM/DD/YYYY
+    (re.compile(r'^(\d{4})/(\d{1,2})/(\d{1,2})$'), '%Y/%m/%d', (1, 2, 3)),  # YYYY/MM/DD
+    (re.compile(r'^(\d{1,2})-(\d{1,2})-(\d{4})$'), '%d-%m-%Y', (3, 2, 1)),  # DD-MM-YYYY
+    (re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{4})$'), '%d.%m.%Y', (3, 2, 1)),  # DD.MM.YYYY
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{2})$'), '%m/%d/%y', (3, 1, 2)),  # MM/DD/YY
+]
+
+_DATE_OUTPUT_FORMATS = {"ISO": '%Y-%m-%d', "US": '%m/%d/%Y', "EU": '%d/%m/%Y'}
+
+# Column name clean-up used by auto_suggest_column_renames
+_RENAME_SPACE = re.compile(r'\s+')
+_RENAME_SPECIAL = re.compile(r'[^a-zA-Z0-9_]')
+_RENAME_MULTI_UNDER = re.compile(r'_+')
+
+# Lowercase forms of the values treated as missing
+_MISSING_MARKERS = frozenset(["", "null", "none", "n/a", "na", "#n/a", "nan"])
+
+_CASE_FUNCTIONS = {
+    "upper": str.upper,
+    "lower": str.lower,
+    "title": str.title,
+    "capitalize": str.capitalize,
+}
+
+
+def _apply_to_strings(values: list, func: Callable[[str], str]) -> int:
+    """Apply func to every string in a column in place and count the changes."""
+    if set(map(type, values)) == {str}:
+        # Plain string column: let map() drive the str method from C
+        new_values = list(map(func, values))
+        changed = sum(map(ne, values, new_values))
+        values[:] = new_values
+        return changed
+    
+    changed = 0
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            new_value = func(value)
+            if new_value != value:
+                values[i] = new_value
+                changed += 1
+    return changed
+
+
+def _weighted_changes(before: list, after: list, weights: Iterable[int], counted: int,
+                      recount: Callable[[list], int]) -> int:
+    """Scale a step's change count over distinct values up to the whole column.
+    
+    Every value a step rewrites counts as a change, but a step may also count
+    values it leaves equal, such as a missing "" filled with "". When the
+    step counted more than it rewrote, those values are found by running the
+    step again on each unchanged value alone.
+    """
+    weights = list(weights)
+    differs = list(map(ne, before, after))
+    total = sum(compress(weights, differs))
+    if counted > sum(differs):
+        for value, weight, changed in zip(before, weights, differs):
+            if not changed and recount([value]):
+                total += weight
+    return total
+
+
+def _clean_column_steps(values: list, key: str, steps: List[Callable[[list, str], int]]) -> List[int]:
+    """Run each step over one column in place and count the changes each made.
+    
+    Repetitive string columns are reduced to their distinct values once, every
+    step runs over those, and the column is rebuilt with a single lookup.
+    The counts match running each step over the full column.
+    """
+    if set(map(type, values)) == {str}:
+        counts = Counter(values)
+        if len(counts) * 2 <= len(values):
+            distinct = list(counts)
+            cleaned = distinct.copy()
+            changes = []
+            for step in steps:
+                before = cleaned.copy()
+                counted = step(cleaned, key)
+                # Weight each changed distinct value by how often it occurs
+                changes.append(_weighted_changes(before, cleaned, counts.values(), counted,
+                                                 partial(step, key=key)))
+            lookup = dict(zip(distinct, cleaned))
+            values[:] = map(lookup.__getitem__, values)
+            return changes
+    
+    return [step(values, key) for step in steps]
+
+
+class _ColumnTable:
+    """Column-major view of a list of row dictionaries."""
+    
+    def __init__(self, data: List[Dict[str, Any]]):
+        header = tuple(data[0])
+        self.row_count = len(data)
+        
+        if header and all(tuple(row) == header for row in data):
+            # Uniform schema: transpose all rows in one pass
+            self.columns = dict(zip(header, map(list, zip(*map(dict.values, data)))))
+            self.templates = None
+        else:
+            # Mixed schemas: keep the source rows to restore each row's own keys
+            keys = dict.fromkeys(key for row in data for key in row)
+            self.columns = {key: list(map(dict.get, data, repeat(key), repeat(_ABSENT))) for key in keys}
+            self.templates = data
+    
+    def keep_rows(self, indices: List[int]) -> None:
+        """Keep only the rows at the given indices."""
+        self.columns = {key: [values[i] for i in indices] for key, values in self.columns.items()}
+        if self.templates is not None:
+            self.templates = [self.templates[i] for i in indices]
+        self.row_count = len(indices)
+    
+    def rename_columns(self, column_mapping: Dict[str, str]) -> None:
+        """Rename columns, letting a later column win when two names collide."""
+        renamed = {}
+        for key, values in self.columns.items():
+            renamed[column_mapping.get(key, key)] = values
+        self.columns = renamed
+    
+    def select_columns(self, names: List[str]) -> None:
+        """Keep only the named columns that exist, in the order given."""
+        self.columns = {name: self.columns[name] for name in names if name in self.columns}
+    
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Convert the table back into a list of row dictionaries."""
+        if self.templates is None:
+            if not self.columns:
+                return [{} for _ in range(self.row_count)]
+            keys = tuple(self.columns)
+            return list(map(dict, map(zip, repeat(keys), zip(*self.columns.values()))))
+        
+        columns = self.columns
+        return [{key: columns[key][i] for key in row} for i, row in enumerate(self.templates)]
+
+
+def _standardize_date_column(values: list, target_format: str, convert: Callable[[str], str]) -> int:
+    """Standardize the dates in one column in place and return how many changed."""
+    changed = 0
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            stripped = value.strip()
+            if not stripped:
+                continue
+            
+            # Every supported format is 6-10 characters and starts and
+            # ends with a digit, so most text skips the regex scan
+            if 6 <= len(stripped) <= 10 and stripped[0].isdigit() and stripped[-1].isdigit():
+                standardized_date = convert(stripped)
+            else:
+                standardized_date = stripped
+            
+            if standardized_date != value:
+                values[i] = standardized_date
+                changed += 1
+    
+    return changed
+
+
+# String hot paths are compiled with Cython rather than Numba: Numba only
+# handles str in object mode, which is no faster than plain Python. Numba is
+# reserved for numeric array work, and nothing in the cleaner is numeric yet.
+try:
+    # Compiled by setup.py when Cython is available
+    from ._fastdates import standardize_date_column as _standardize_date_column
+except ImportError:
+    try:
+        from _fastdates import standardize_date_column as _standardize_date_column
+    except ImportError:
+        pass
 
 
 class DataCleaner:
@@ -40,89 +269,276 @@ class DataCleaner:
     
     def __init__(self):
         self.cleaning_stats = {}
+        self._seen_rows: Dict[tuple, dict] = {}
+        self._rows_checked = 0
+        self._pool = None  # Worker processes, started on first parallel batch
+        self._pool_workers = 0
+    
+    def __enter__(self) -> "DataCleaner":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
     
     def clean_data(self, data: List[Dict[str, Any]], config: CleaningConfig) -> List[Dict[str, Any]]:
         """Apply cleaning operations based on configuration."""
         if not data:
             return data
         
-        cleaned = copy.deepcopy(data)
-        self.cleaning_stats = {"original_rows": len(data)}
-        
-        # Apply cleaning operations in order
-        if config.trim_whitespace:
-            cleaned = self._trim_whitespace(cleaned)
-        
-        if config.remove_duplicates:
-            cleaned = self._remove_duplicates(cleaned)
+        self.reset()
+        return self._clean_table(data, config, remember_rows=False)
+    
+    def clean_and_report(self, data: List[Dict[str, Any]],
+                         config: CleaningConfig) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Clean the data and build its issues report from the same column pass."""
+        detector = IssueDetector()
+        if not data:
+            return data, detector.report()
         
-        if config.fill_missing:
-            cleaned = self._fill_missing_values(cleaned, config.fill_defaults or {})
+        self.reset()
+        cleaned = self._clean_table(data, config, remember_rows=False, detector=detector)
+        return cleaned, detector.report()
+    
+    def reset(self) -> None:
+        """Clear statistics and duplicate tracking from previous batches."""
+        self.cleaning_stats = {"original_rows": 0, "final_rows": 0, "rows_removed": 0}
+        self._seen_rows = {}
+        self._rows_checked = 0
+    
+    def clean_batch(self, data: List[Dict[str, Any]], config: CleaningConfig,
+                    detector: Optional[IssueDetector] = None) -> List[Dict[str, Any]]:
+        """Clean one batch of a larger dataset.
+        
+        Statistics accumulate across batches and duplicates are removed
+        against every row kept since the last reset(). A detector, if given,
+        is updated with the batch before it is cleaned.
+        """
+        if not data:
+            return data
         
-        if config.standardize_dates:
-            cleaned = self._standardize_dates(cleaned, config.date_format)
+        return self._clean_table(data, config, remember_rows=True, detector=detector)
+    
+    def _clean_table(self, data: List[Dict[str, Any]], config: CleaningConfig, remember_rows: bool,
+                     detector: Optional[IssueDetector] = None) -> List[Dict[str, Any]]:
+        """Run the cleaning pipeline over one non-empty batch."""
         
-        if config.normalize_case:
-            cleaned = self._normalize_case(cleaned, config.case_type)
+        # Value-level operations work column by column on a transposed copy
+        table = _ColumnTable(data)
         
-        if config.rename_columns:
-            cleaned = self._rename_columns(cleaned, config.column_mapping or {})
+        if detector is not None:
+            # Analyze the raw columns before any step rewrites them
+            if table.templates is None:
+                detector.update_columns(table.columns)
+            else:
+                detector.update(data)
         
-        if config.filter_columns:
-            cleaned = self._filter_columns(cleaned, config.filter_columns or [])
+        # Apply cleaning operations in order
+        if config.remove_duplicates:
+            self._clean_columns(table.columns, config, _STEPS_BEFORE_DEDUP)
+            self._remove_duplicates(table, remember_rows, config.dedup_subset)
+            self._clean_columns(table.columns, config, _STEPS_AFTER_DEDUP)
+        else:
+            # Nothing runs between the two phases, so every step shares one
+            # pass over each column's distinct values
+            self._clean_columns(table.columns, config, _STEPS_BEFORE_DEDUP + _STEPS_AFTER_DEDUP)
+        
+        if table.templates is None:
+            # Every row has the same keys, so columns are renamed and
+            # filtered before the rows are rebuilt
+            if config.rename_columns and config.column_mapping:
+                table.rename_columns(config.column_mapping)
+                self.cleaning_stats["columns_renamed"] = len(config.column_mapping)
+            
+            if config.filter_columns:
+                original_columns = len(table.columns)
+                table.select_columns(config.filter_columns)
+                self.cleaning_stats["columns_removed"] = original_columns - len(table.columns)
+            
+            cleaned = table.to_rows()
+        else:
+            cleaned = table.to_rows()
+            
+            if config.rename_columns:
+                cleaned = self._rename_columns(cleaned, config.column_mapping or {})
+            
+            if config.filter_columns:
+                cleaned = self._filter_columns(cleaned, config.filter_columns or [])
         
-        self.cleaning_stats["final_rows"] = len(cleaned)
-        self.cleaning_stats["rows_removed"] = self.cleaning_stats["original_rows"] - len(cleaned)
+        self._add_stat("original_rows", len(data))
+        self._add_stat("final_rows", len(cleaned))
+        self._add_stat("rows_removed", len(data) - len(cleaned))
         
         return cleaned
     
-    def _trim_whitespace(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _clean_columns(self, columns: Dict[str, list], config: CleaningConfig, steps: tuple) -> None:
+        """Run the enabled value-level steps, spreading columns over worker processes."""
+        steps = tuple(step for step in steps if getattr(config, step))
+        if not steps:
+            return
+        
+        if (config.workers <= 1 or len(columns) <= 1
+                or len(next(iter(columns.values()))) < _PARALLEL_MIN_ROWS):
+            self._apply_steps(columns, config, steps)
+            return
+        
+        tasks = [({key: values}, config, steps) for key, values in columns.items()]
+        for cleaned_columns, stats in self._worker_pool(config.workers).map(_clean_columns_task, *zip(*tasks)):
+            columns.update(cleaned_columns)
+            for name, count in stats.items():
+                self._add_stat(name, count)
+    
+    def _worker_pool(self, workers: int) -> Any:
+        """Return the process pool, reused across batches until close()."""
+        if self._pool is None or self._pool_workers != workers:
+            self.close()
+            # Imported here so serial runs never load multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=workers)
+            self._pool_workers = workers
+        return self._pool
+    
+    def _apply_steps(self, columns: Dict[str, list], config: CleaningConfig, steps: tuple) -> None:
+        """Run value-level steps over columns in this process."""
+        # Resolve the config into per-column functions once, so each column
+        # runs only the enabled steps with their settings already bound
+        stat_names = []
+        functions = []
+        for step in steps:
+            if step == "trim_whitespace":
+                stat_names.append("whitespace_trimmed")
+                functions.append(self._trim_whitespace)
+            elif step == "fill_missing":
+                stat_names.append("missing_values_filled")
+                functions.append(partial(self._fill_missing_values, fill_defaults=config.fill_defaults or {}))
+            elif step == "standardize_dates":
+                stat_names.append("dates_standardized")
+                functions.append(partial(self._standardize_dates, target_format=config.date_format))
+            elif step == "normalize_case":
+                stat_names.append("cases_normalized")
+                functions.append(partial(self._normalize_case, case_type=config.case_type))
+        
+        totals = [0] * len(functions)
+        for key, values in columns.items():
+            totals = list(map(add, totals, _clean_column_steps(values, key, functions)))
+        
+        for name, count in zip(stat_names, totals):
+            self._add_stat(name, count)
+    
+    def _add_stat(self, name: str, count: int) -> None:
+        """Add a count to the running cleaning statistics."""
+        self.cleaning_stats[name] = self.cleaning_stats.get(name, 0) + count
+    
+    def _trim_whitespace(self, values: list, key: str) -> int:
         """Remove leading and trailing whitespace from string values."""
-        trimmed_count = 0
-        
-        for row in data:
-            for key, value in row.items():
-                if isinstance(value, str):
-                    trimmed_value = value.strip()
-                    if trimmed_value != value:
-                        trimmed_count += 1
-                        row[key] = trimmed_value
-        
-        self.cleaning_stats["whitespace_trimmed"] = trimmed_count
-        return data
-    
-    def _remove_duplicates(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate rows from the dataset."""
-        seen = set()
-        unique_data = []
-        duplicates_removed = 0
-        
-        for row in data:
-            # Convert row to tuple for hashing
-            row_tuple = tuple(sorted(row.items()))
-            if row_tuple not in seen:
-                seen.add(row_tuple)
-                unique_data.append(row)
-            else:
-                duplicates_removed += 1
-        
-        self.cleaning_stats["duplicates_removed"] = duplicates_removed
-        return unique_data
+        return _apply_to_strings(values, str.strip)
+    
+    def _remove_duplicates(self, table: _ColumnTable, remember_rows: bool = True,
+                           subset: Optional[List[str]] = None) -> None:
+        """Remove duplicate rows from the dataset.
+        
+        Rows seen are kept for later batches only when remember_rows is set.
+        """
+        # A single call keeps its keys local, so they are freed once it returns
+        seen_rows = self._seen_rows if remember_rows else {}
+        if subset:
+            self._remove_duplicates_by(table, subset, seen_rows)
+            return
+        
+        if not remember_rows and table.templates is None and table.columns:
+            # A complete table whose leading column never repeats has no
+            # duplicates, so the remaining columns need not be read at all
+            leading = next(iter(table.columns.values()))
+            if len(set(leading)) == table.row_count:
+                self._add_stat("duplicates_removed", 0)
+                return
+        
+        # Rows are keyed by their sorted column names so that batches with a
+        # different column order still compare equal. Each key maps to the
+        # number of the first row that produced it, so a row is kept only if
+        # it is that first row.
+        names = sorted(table.columns)
+        row_values = zip(*(table.columns[name] for name in names)) if names else iter([()] * table.row_count)
+        row_numbers = range(self._rows_checked, self._rows_checked + table.row_count)
+        self._rows_checked += table.row_count
+        
+        if table.templates is None:
+            seen = seen_rows.setdefault(tuple(names), {})
+            first_rows = map(seen.setdefault, row_values, row_numbers)
+        else:
+            first_rows = []
+            for values, number in zip(row_values, row_numbers):
+                present = [(name, value) for name, value in zip(names, values) if value is not _ABSENT]
+                seen = seen_rows.setdefault(tuple(name for name, _ in present), {})
+                first_rows.append(seen.setdefault(tuple(value for _, value in present), number))
+        
+        unique_indices = list(compress(range(table.row_count), map(eq, first_rows, row_numbers)))
+        
+        self._add_stat("duplicates_removed", table.row_count - len(unique_indices))
+        table.keep_rows(unique_indices)
     
-    def _fill_missing_values(self, data: List[Dict[str, Any]], fill_defaults: Dict[str, str]) -> List[Dict[str, Any]]:
+    def check_dedup_subset(self, subset: List[str], columns: Iterable[str]) -> None:
+        """Raise DataMenderError if a subset column is not among the data's columns."""
+        columns = set(columns)
+        unknown = [name for name in subset if name not in columns]
+        if unknown:
+            raise DataMenderError(f"Unknown column(s) for duplicate check: {', '.join(unknown)}")
+    
+    def _remove_duplicates_by(self, table: _ColumnTable, subset: List[str],
+                              seen_rows: Dict[tuple, dict]) -> None:
+        """Remove rows whose values in the subset columns were already seen."""
+        if not self._rows_checked:
+            # A misspelled column would match every row, so it is caught on
+            # the first batch instead of dropping all rows but one
+            self.check_dedup_subset(subset, table.columns)
+        
+        absent = [_ABSENT] * table.row_count
+        keys = [table.columns.get(name, absent) for name in subset]
+        
+        # A single column is its own key, so no row tuples are built
+        row_keys = keys[0] if len(keys) == 1 else zip(*keys)
+        row_numbers = range(self._rows_checked, self._rows_checked + table.row_count)
+        self._rows_checked += table.row_count
+        
+        seen = seen_rows.setdefault(tuple(subset), {})
+        first_rows = map(seen.setdefault, row_keys, row_numbers)
+        unique_indices = list(compress(range(table.row_count), map(eq, first_rows, row_numbers)))
+        
+        self._add_stat("duplicates_removed", table.row_count - len(unique_indices))
+        table.keep_rows(unique_indices)
+    
+    def _fill_missing_values(self, values: list, key: str, fill_defaults: Dict[str, str]) -> int:
         """Fill missing values with specified defaults."""
         filled_count = 0
         
-        for row in data:
-            for key, value in row.items():
-                if self._is_missing_value(value):
-                    # Use column-specific default or global default
-                    default_value = fill_defaults.get(key, fill_defaults.get("_default", ""))
-                    row[key] = default_value
-                    filled_count += 1
+        # Use column-specific default or global default
+        default_value = fill_defaults.get(key, fill_defaults.get("_default", ""))
+        markers = _MISSING_MARKERS
+        # The same checks as _is_missing_value, inlined to save a method call per cell
+        for i, value in enumerate(values):
+            if value is None:
+                pass
+            elif type(value) is str:
+                # Every missing marker is at most four characters once stripped,
+                # so longer unpadded strings are ruled out before the full check
+                if value not in markers and (
+                    (len(value) > 4 and not value[0].isspace() and not value[-1].isspace())
+                    or value.strip().lower() not in markers
+                ):
+                    continue
+            elif not self._is_missing_value(value):
+                continue
+            
+            values[i] = default_value
+            filled_count += 1
         
-        self.cleaning_stats["missing_values_filled"] = filled_count
-        return data
+        return filled_count
     
     def _is_missing_value(self, value: Any) -> bool:
         """Check if a value is considered missing."""
@@ -130,82 +546,59 @@ class DataCleaner:
             return True
         
         if isinstance(value, str):
-            cleaned_value = value.strip().lower()
-            return cleaned_value in ["", "null", "none", "n/a", "na", "#n/a", "nan"]
+            # Values that already are a marker need neither strip() nor lower()
+            return value in _MISSING_MARKERS or value.strip().lower() in _MISSING_MARKERS
         
         return False
     
-    def _standardize_dates(self, data: List[Dict[str, Any]], target_format: str) -> List[Dict[str, Any]]:
-        """Standardize date formats across the dataset."""
-        dates_converted = 0
-        
-        # Common date patterns
-        date_patterns = [
-            (r'^(\d{4})-(\d{1,2})-(\d{1,2})$', '%Y-%m-%d'),  # YYYY-MM-DD
-            (r'^(\d{1,2})/(\d{1,2})/(\d{4})$', '%m/%d/%Y'),  # MM/DD/YYYY
-            (r'^(\d{4})/(\d{1,2})/(\d{1,2})$', '%Y/%m/%d'),  # YYYY/MM/DD
-            (r'^(\d{1,2})-(\d{1,2})-(\d{4})$', '%d-%m-%Y'),  # DD-MM-YYYY
-            (r'^(\d{1,2})\.(\d{1,2})\.(\d{4})$', '%d.%m.%Y'),  # DD.MM.YYYY
-            (r'^(\d{1,2})/(\d{1,2})/(\d{2})$', '%m/%d/%y'),  # MM/DD/YY
-        ]
-        
-        for row in data:
-            for key, value in row.items():
-                if isinstance(value, str) and value.strip():
-                    standardized_date = self._convert_date(value.strip(), date_patterns, target_format)
-                    if standardized_date != value:
-                        row[key] = standardized_date
-                        dates_converted += 1
-        
-        self.cleaning_stats["dates_standardized"] = dates_converted
-        return data
+    def _standardize_dates(self, values: list, key: str, target_format: str) -> int:
+        """Standardize date formats across one column."""
+        convert = partial(self._convert_date, patterns=_DATE_PATTERNS, target_format=target_format)
+        return _standardize_date_column(values, target_format, convert)
     
     def _convert_date(self, date_str: str, patterns: List[tuple], target_format: str) -> str:
         """Convert date string to target format."""
-        for pattern, format_str in patterns:
+        target_format = target_format.upper()
+        for pattern, format_str, groups in patterns:
             try:
-                if re.match(pattern, date_str):
-                    # Parse the date
-                    date_obj = datetime.strptime(date_str, format_str)
+                match = pattern.match(date_str)
+                # '$' also matches before a trailing newline, which strptime rejects
+                if match and match.end() == len(date_str):
+                    if date_str.isascii():
+                        # The pattern has already split out the fields, so
+                        # the date is built from them instead of parsed again
+                        year, month, day = map(int, match.group(*groups))
+                        if format_str.endswith('%y'):
+                            year += 2000 if year < 69 else 1900  # strptime's century pivot
+                        date_obj = datetime(year, month, day)
+                    else:
+                        # strptime decides which non-ASCII digits it accepts
+                        date_obj = datetime.strptime(date_str, format_str)
                     
                     # Convert to target format
-                    if target_format.upper() == "ISO":
-                        return date_obj.strftime('%Y-%m-%d')
-                    elif target_format.upper() == "US":
-                        return date_obj.strftime('%m/%d/%Y')
-                    elif target_format.upper() == "EU":
-                        return date_obj.strftime('%d/%m/%Y')
+                    if date_obj.year < 1000:
+                        # strftime pads these years differently across platforms
+                        return date_obj.strftime(_DATE_OUTPUT_FORMATS.get(target_format, '%Y-%m-%d'))
+                    elif target_format == "US":
+                        return "%02d/%02d/%d" % (date_obj.month, date_obj.day, date_obj.year)
+                    elif target_format == "EU":
+                        return "%02d/%02d/%d" % (date_obj.day, date_obj.month, date_obj.year)
                     else:
-                        return date_obj.strftime('%Y-%m-%d')  # Default to ISO
+                        return "%d-%02d-%02d" % (date_obj.year, date_obj.month, date_obj.day)  # Default to ISO
             except ValueError:
                 continue
         
         # If no pattern matches, return original
         return date_str
     
-    def _normalize_case(self, data: List[Dict[str, Any]], case_type: str) -> List[Dict[str, Any]]:
-        """Normalize string case across the dataset."""
-        cases_normalized = 0
-        
-        for row in data:
-            for key, value in row.items():
-                if isinstance(value, str) and value.strip():
-                    original_value = value
-                    
-                    if case_type.lower() == "upper":
-                        row[key] = value.upper()
-                    elif case_type.lower() == "lower":
-                        row[key] = value.lower()
-                    elif case_type.lower() == "title":
-                        row[key] = value.title()
-                    elif case_type.lower() == "capitalize":
-                        row[key] = value.capitalize()
-                    
-                    if row[key] != original_value:
-                        cases_normalized += 1
-        
-        self.cleaning_stats["cases_normalized"] = cases_normalized
-        return data
+    def _normalize_case(self, values: list, key: str, case_type: str) -> int:
+        """Normalize string case across one column."""
+        case_function = _CASE_FUNCTIONS.get(case_type.lower())
+        
+        # Blank strings have no case, so they never count as changed
+        if case_function is None:
+            return 0
+        return _apply_to_strings(values, case_function)
     
     def _rename_columns(self, data: List[Dict[str, Any]], column_mapping: Dict[str, str]) -> List[Dict[str, Any]]:
         """Rename columns based on mapping."""
@@ -258,15 +651,22 @@ class DataCleaner:
         
         for column in columns:
             # Convert spaces to underscores and make lowercase
-            suggested_name = re.sub(r'\s+', '_', column.strip().lower())
+            suggested_name = _RENAME_SPACE.sub('_', column.strip().lower())
             # Remove special characters except underscores
-            suggested_name = re.sub(r'[^a-zA-Z0-9_]', '', suggested_name)
+            suggested_name = _RENAME_SPECIAL.sub('', suggested_name)
             # Remove multiple underscores
-            suggested_name = re.sub(r'_+', '_', suggested_name)
+            suggested_name = _RENAME_MULTI_UNDER.sub('_', suggested_name)
             # Remove leading/trailing underscores
             suggested_name = suggested_name.strip('_')
             
             if suggested_name != column and suggested_name:
                 suggestions[column] = suggested_name
         
-        return suggestions
\ No newline at end of file
+        return suggestions
+
+
+def _clean_columns_task(columns: Dict[str, list], config: CleaningConfig, steps: tuple) -> tuple:
+    """Worker process entry point for DataCleaner._clean_columns."""
+    cleaner = DataCleaner()
+    cleaner._apply_steps(columns, config, steps)
+    return columns, cleaner.cleaning_stats
@@ -10,9 +10,47 @@ import os
 import copy
 import re
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from itertools import chain, compress, islice, repeat
+from operator import eq, itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from pathlib import Path
 
+try:
+    from .table_utils import rows_to_columns
+except ImportError:
+    from table_utils import rows_to_columns
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the json module is used instead
+    orjson = None
+
+# Maps ASCII digits to "1", "." to itself and every other byte to "0", so
+# digit runs that are not a fraction can be found with a substring search
+_DIGIT_MASK = bytes(49 if 48 <= byte <= 57 else byte if byte == 46 else 48 for byte in range(256))
+_LONG_DIGIT_RUN = b"0" + b"1" * 19
+
+# Values the detector reports as missing, once stripped
+_MISSING_MARKERS = frozenset(["", "null", "NULL", "None", "N/A", "n/a"])
+
+# pyarrow is optional and slow to import, so it is loaded on the first CSV read
+pa = None
+pa_csv = None
+
+
+def _import_pyarrow() -> bool:
+    """Import pyarrow if it is installed; the csv module is used otherwise."""
+    global pa, pa_csv
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.csv
+        except ImportError:
+            pa = False
+        else:
+            pa, pa_csv = pyarrow, pyarrow.csv
+    return pa is not False
+
 
 class DataMenderError(Exception):
     """Base exception for DataMender operations."""
@@ -24,16 +62,114 @@ class UnsupportedFormatError(DataMenderError):
     pass
 
 
+# Rows sampled before deciding whether a column repeats enough to share values
+_SHARE_SAMPLE_ROWS = 1000
+
+
+def _share_string_values(data: List[Dict[str, Any]]) -> None:
+    """Make equal string values within a column share one string object."""
+    caches: Dict[str, Dict[str, str]] = {}
+    unshared = set()
+    
+    for index, row in enumerate(data):
+        if index == _SHARE_SAMPLE_ROWS:
+            # Mostly unique columns (ids, emails) would only grow the cache
+            for key, cache in list(caches.items()):
+                if len(cache) * 2 > index:
+                    del caches[key]
+                    unshared.add(key)
+        if not isinstance(row, dict):
+            continue
+        for key, value in row.items():
+            if type(value) is str:
+                cache = caches.get(key)
+                if cache is None:
+                    if key in unshared:
+                        continue
+                    cache = caches[key] = {}
+                row[key] = cache.setdefault(value, value)
+
+
+def _share_column_values(values: List[Any]) -> List[Any]:
+    """Make equal values in one column share one object, unless it is mostly unique."""
+    sample = values[:_SHARE_SAMPLE_ROWS]
+    if len(set(sample)) * 2 > len(sample) >= _SHARE_SAMPLE_ROWS:
+        return values
+    cache = {}
+    return list(map(cache.setdefault, values, values))
+
+
+# Value types orjson writes exactly as json.dumps does
+_ORJSON_SAFE_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _dump_json(rows: List[Dict[str, Any]]) -> str:
+    """Serialize rows like json.dumps(indent=2, ensure_ascii=False), with orjson when it matches."""
+    if orjson is not None and set(map(type, rows)) == {dict}:
+        values = list(chain.from_iterable(map(dict.values, rows)))
+        types = set(map(type, values))
+        # orjson writes NaN and infinity as null and formats exponents
+        # differently from repr(), so only plainly written floats qualify
+        if types <= _ORJSON_SAFE_TYPES and (
+                float not in types
+                or all(v == 0 or 1e-4 <= abs(v) < 1e16 for v in values if type(v) is float)):
+            try:
+                return orjson.dumps(rows, option=orjson.OPT_INDENT_2).decode('utf-8')
+            except TypeError:
+                # Integers beyond 64 bits and non-string keys
+                pass
+    
+    return json.dumps(rows, indent=2, ensure_ascii=False)
+
+
+def _ragged_csv_row(header: List[str], row: List[str]) -> Dict[str, Any]:
+    """Build a row dictionary the way csv.DictReader does when the row length differs."""
+    record: Dict[str, Any] = dict(zip(header, row))
+    if len(header) < len(row):
+        record[None] = row[len(header):]
+    else:
+        for key in header[len(row):]:
+            record[key] = None
+    return record
+
+
+def _arrow_table(rows: List[Dict[str, Any]], fieldnames: List[str], schema: Any = None) -> Any:
+    """Build a pyarrow Table from rows, matching schema when one is given."""
+    extra = set().union(*rows).difference(fieldnames)
+    if extra:
+        raise DataMenderError(f"Rows contain columns not in the first row: {', '.join(map(repr, sorted(extra)))}")
+    
+    arrays = []
+    for i, name in enumerate(fieldnames):
+        values = [row.get(name) for row in rows]
+        arrow_type = schema.field(i).type if schema is not None else None
+        try:
+            arrays.append(pa.array(values, arrow_type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            if arrow_type is not None and arrow_type != pa.string():
+                raise
+            # Columns that mix value types are written as text
+            arrays.append(pa.array([None if value is None else str(value) for value in values], pa.string()))
+    
+    return pa.Table.from_arrays(arrays, schema=schema) if schema is not None else pa.Table.from_arrays(arrays, fieldnames)
+
+
 class DataProcessor:
     """Core data processing engine for DataMender."""
     
-    def __init__(self):
+    def __init__(self, preserve_original: bool = False):
         self.data: List[Dict[str, Any]] = []
         self.original_data: List[Dict[str, Any]] = []
         self.issues_report: Dict[str, Any] = {}
+        # Deep-copy loaded rows into original_data instead of copying each row
+        self.preserve_original = preserve_original
+        
+    def load_data(self, file_path: str, delimiter: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Load data from CSV, JSON, Parquet or Arrow file.
         
-    def load_data(self, file_path: str) -> List[Dict[str, Any]]:
-        """Load data from CSV or JSON file."""
+        The CSV delimiter is detected from the start of the file unless one
+        is given.
+        """
         path = Path(file_path)
         
         if not path.exists():
@@ -42,39 +178,137 @@ class DataProcessor:
         extension = path.suffix.lower()
         
         if extension == '.csv':
-            return self._load_csv(file_path)
+            return self._load_csv(file_path, delimiter)
         elif extension == '.json':
             return self._load_json(file_path)
+        elif extension in ('.parquet', '.arrow'):
+            return self._load_arrow(file_path)
         else:
             raise UnsupportedFormatError(f"Unsupported file format: {extension}")
     
-    def _load_csv(self, file_path: str) -> List[Dict[str, Any]]:
-        """Load CSV file into list of dictionaries."""
-        data = []
+    def iter_batches(self, file_path: str, batch_size: int = 65536,
+                     delimiter: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Load data from CSV, JSON, Parquet or Arrow file in batches of rows.
+        
+        CSV, Parquet and Arrow files are read incrementally, so only one batch
+        is held in memory at a time. JSON files are parsed in full and then
+        split into batches.
+        """
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        extension = path.suffix.lower()
+        
+        if extension == '.csv':
+            rows = self._read_csv_rows(file_path, delimiter)
+        elif extension == '.json':
+            rows = iter(self._read_json_rows(file_path))
+        elif extension in ('.parquet', '.arrow'):
+            rows = self._read_arrow_rows(file_path)
+        else:
+            raise UnsupportedFormatError(f"Unsupported file format: {extension}")
+        
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            _share_string_values(batch)
+            yield batch
+    
+    def _read_csv_rows(self, file_path: str, delimiter: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Read CSV file row by row as dictionaries."""
         try:
             with open(file_path, 'r', encoding='utf-8', newline='') as file:
-                # Detect delimiter
-                sample = file.read(1024)
-                file.seek(0)
+                if delimiter is None:
+                    # Detect delimiter
+                    sample = file.read(1024)
+                    file.seek(0)
+                    
+                    sniffer = csv.Sniffer()
+                    delimiter = sniffer.sniff(sample).delimiter
                 
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
+                # csv.reader plus zip() builds each row in C, where DictReader
+                # runs Python code per row; rows of the wrong length are
+                # filled in the same way DictReader fills them
+                reader = csv.reader(file, delimiter=delimiter)
+                header = next(reader, None)
+                if header is None:
+                    return
                 
-                reader = csv.DictReader(file, delimiter=delimiter)
-                data = [row for row in reader]
+                width = len(header)
+                for row in reader:
+                    if len(row) == width and width:
+                        yield dict(zip(header, row))
+                    elif row:
+                        yield _ragged_csv_row(header, row)
                 
         except Exception as e:
             raise DataMenderError(f"Error reading CSV file: {e}")
-            
+    
+    def _read_csv_arrow(self, file_path: str, delimiter: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Parse CSV file with pyarrow, or return None to fall back to the csv module."""
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as file:
+                sample = file.read(1024)
+                file.seek(0)
+                
+                if delimiter is None:
+                    delimiter = csv.Sniffer().sniff(sample).delimiter
+                header = next(csv.reader(file, delimiter=delimiter), None)
+        except Exception:
+            return None
+        
+        # The csv module keeps a byte order mark and repeated names as they are
+        if not header or sample.startswith('\ufeff') or len(set(header)) != len(header):
+            return None
+        
+        try:
+            # Map the file so pages are read on demand instead of copied into
+            # a Python buffer first
+            with pa.memory_map(file_path, 'r') as source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(block_size=1 << 20, use_threads=True),
+                    parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={name: pa.string() for name in header},
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False
+                    )
+                )
+        except (pa.ArrowException, ValueError):
+            # Ragged rows and similar input are left to the csv module
+            return None
+        
+        if table.column_names != header:
+            return None
+        
+        # Share repeated values while the data is still column-major
+        columns = []
+        for column in table.columns:
+            columns.append(_share_column_values(column.to_pylist()))
+        
+        return [dict(zip(header, values)) for values in zip(*columns)]
+    
+    def _load_csv(self, file_path: str, delimiter: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Load CSV file into list of dictionaries."""
+        data = self._read_csv_arrow(file_path, delimiter) if _import_pyarrow() else None
+        if data is None:
+            data = list(self._read_csv_rows(file_path, delimiter))
+            _share_string_values(data)
+        
         self.data = data
-        self.original_data = copy.deepcopy(data)
+        self.original_data = self._copy_original(data)
         return data
     
-    def _load_json(self, file_path: str) -> List[Dict[str, Any]]:
-        """Load JSON file into list of dictionaries."""
+    def _read_json_rows(self, file_path: str) -> List[Dict[str, Any]]:
+        """Parse JSON file into list of dictionaries."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                json_data = json.load(file)
+            with open(file_path, 'rb') as file:
+                content = file.read()
+            json_data = self._parse_json(content)
                 
             # Handle different JSON structures
             if isinstance(json_data, list):
@@ -89,205 +323,445 @@ class DataProcessor:
             raise DataMenderError(f"Invalid JSON format: {e}")
         except Exception as e:
             raise DataMenderError(f"Error reading JSON file: {e}")
-            
+        
+        return data
+    
+    def _parse_json(self, content: bytes) -> Any:
+        """Parse JSON text, with orjson when it is installed."""
+        # orjson reads integers beyond 64 bits as floats, so any long
+        # integer-like digit run sends the file to json instead
+        if orjson is not None and _LONG_DIGIT_RUN not in content.translate(_DIGIT_MASK):
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # orjson also rejects some input json accepts (NaN, lone
+                # surrogates), so json gets the final say
+                pass
+        
+        return json.loads(content.decode('utf-8'))
+    
+    def _load_json(self, file_path: str) -> List[Dict[str, Any]]:
+        """Load JSON file into list of dictionaries."""
+        data = self._read_json_rows(file_path)
+        
+        _share_string_values(data)
+        self.data = data
+        self.original_data = self._copy_original(data)
+        return data
+    
+    def _load_arrow(self, file_path: str) -> List[Dict[str, Any]]:
+        """Load Parquet or Arrow IPC file into list of dictionaries."""
+        data = list(self._read_arrow_rows(file_path))
+        
+        _share_string_values(data)
         self.data = data
-        self.original_data = copy.deepcopy(data)
+        self.original_data = self._copy_original(data)
         return data
     
-    def save_data(self, output_path: str, data: Optional[List[Dict[str, Any]]] = None) -> None:
-        """Save data to CSV or JSON file."""
+    def _copy_original(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copy loaded rows for original_data."""
+        if self.preserve_original:
+            return copy.deepcopy(data)
+        # Cleaning only rebinds top-level values, so a copy of each row is enough
+        return list(map(copy.copy, data))
+    
+    def _read_arrow_rows(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Parse Parquet or Arrow IPC file one record batch at a time."""
+        if not _import_pyarrow():
+            raise DataMenderError("Reading Parquet and Arrow files requires pyarrow")
+        
+        try:
+            # Batches read from a mapped file reference the mapping without copying
+            with pa.memory_map(file_path, 'r') as source:
+                if Path(file_path).suffix.lower() == '.parquet':
+                    import pyarrow.parquet as pa_parquet
+                    record_batches = pa_parquet.ParquetFile(source).iter_batches()
+                else:
+                    reader = pa.ipc.open_file(source)
+                    record_batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+                
+                for record_batch in record_batches:
+                    yield from record_batch.to_pylist()
+                
+        except Exception as e:
+            raise DataMenderError(f"Error reading file: {e}")
+    
+    def save_data(self, output_path: str, data: Optional[List[Dict[str, Any]]] = None,
+                  output_format: Optional[str] = None) -> None:
+        """Save data to CSV, JSON, Parquet or Arrow file."""
         if data is None:
             data = self.data
-            
+        
+        self.save_batches(output_path, [data], output_format)
+    
+    def save_batches(self, output_path: str, batches: Iterable[List[Dict[str, Any]]],
+                     output_format: Optional[str] = None) -> None:
+        """Save batches of rows to a file as they are produced.
+        
+        The format is taken from output_format ("csv", "json", "parquet" or
+        "arrow") or, when that is not given, from the file extension.
+        """
         path = Path(output_path)
-        extension = path.suffix.lower()
+        extension = f".{output_format.lower()}" if output_format else path.suffix.lower()
+        
+        if extension not in ('.csv', '.json', '.parquet', '.arrow'):
+            raise UnsupportedFormatError(f"Unsupported output format: {extension}")
         
         # Create directory if it doesn't exist
         path.parent.mkdir(parents=True, exist_ok=True)
         
         if extension == '.csv':
-            self._save_csv(output_path, data)
+            self._save_csv(output_path, batches)
         elif extension == '.json':
-            self._save_json(output_path, data)
+            self._save_json(output_path, batches)
         else:
-            raise UnsupportedFormatError(f"Unsupported output format: {extension}")
+            self._save_arrow(output_path, batches, parquet=extension == '.parquet')
     
-    def _save_csv(self, file_path: str, data: List[Dict[str, Any]]) -> None:
+    def _save_csv(self, file_path: str, batches: Iterable[List[Dict[str, Any]]]) -> None:
         """Save data as CSV file."""
-        if not data:
+        batches = (batch for batch in batches if batch)
+        first_batch = next(batches, None)
+        if first_batch is None:
             raise DataMenderError("No data to save")
             
         try:
             with open(file_path, 'w', encoding='utf-8', newline='') as file:
-                fieldnames = data[0].keys()
+                fieldnames = tuple(first_batch[0].keys())
                 writer = csv.DictWriter(file, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerows(data)
+                value_writer = csv.writer(file)
+                getter = itemgetter(*fieldnames) if fieldnames else None
+                for batch in chain((first_batch,), batches):
+                    if getter and all(map(eq, map(tuple, batch), repeat(fieldnames))):
+                        # Rows with exactly the header's keys are written as
+                        # value tuples, skipping DictWriter's per-row checks
+                        values = map(getter, batch)
+                        value_writer.writerows(zip(values) if len(fieldnames) == 1 else values)
+                    else:
+                        writer.writerows(batch)
+        except DataMenderError:
+            raise
         except Exception as e:
             raise DataMenderError(f"Error saving CSV file: {e}")
     
-    def _save_json(self, file_path: str, data: List[Dict[str, Any]]) -> None:
+    def _save_json(self, file_path: str, batches: Iterable[List[Dict[str, Any]]]) -> None:
         """Save data as JSON file."""
         try:
             with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+                separator = "[\n"
+                for batch in batches:
+                    if batch:
+                        # Drop the enclosing "[\n" and "\n]" so batches join into one array
+                        file.write(separator)
+                        file.write(_dump_json(batch)[2:-2])
+                        separator = ",\n"
+                file.write("[]" if separator == "[\n" else "\n]")
+        except DataMenderError:
+            raise
         except Exception as e:
             raise DataMenderError(f"Error saving JSON file: {e}")
     
-    def detect_issues(self, data: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
-        """Detect common data quality issues."""
+    def _save_arrow(self, file_path: str, batches: Iterable[List[Dict[str, Any]]], parquet: bool) -> None:
+        """Save data as a zstd-compressed Parquet file or an Arrow IPC file."""
+        if not _import_pyarrow():
+            raise DataMenderError("Parquet and Arrow output require pyarrow")
+        
+        batches = (batch for batch in batches if batch)
+        first_batch = next(batches, None)
+        if first_batch is None:
+            raise DataMenderError("No data to save")
+        
+        writer = None
+        try:
+            # Columns come from the first row. A lone batch keeps the types
+            # pyarrow infers for it; with more batches every column is text,
+            # as a later batch may not fit types inferred from the first
+            # (a column all null at first, or ints that later turn to text)
+            fieldnames = list(first_batch[0].keys())
+            second_batch = next(batches, None)
+            if second_batch is None:
+                schema = None
+            else:
+                schema = pa.schema([(name, pa.string()) for name in fieldnames])
+                batches = chain([second_batch], batches)
+            for batch in chain([first_batch], batches):
+                table = _arrow_table(batch, fieldnames, schema)
+                if writer is None:
+                    schema = table.schema
+                    if parquet:
+                        import pyarrow.parquet as pa_parquet
+                        writer = pa_parquet.ParquetWriter(file_path, schema, compression="zstd")
+                    else:
+                        writer = pa.ipc.new_file(file_path, schema)
+                writer.write_table(table)
+        except DataMenderError:
+            raise
+        except Exception as e:
+            raise DataMenderError(f"Error saving {'Parquet' if parquet else 'Arrow'} file: {e}")
+        finally:
+            if writer is not None:
+                writer.close()
+    
+    def detect_issues(self, data: Optional[List[Dict[str, Any]]] = None,
+                      batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """Detect common data quality issues.
+        
+        The checks run one after another on purpose. Each is a pure-Python
+        loop over str objects that holds the GIL, so a thread pool would
+        only add contention; they are worth running concurrently only once
+        they work on buffers that release it. For multi-core cleaning, use
+        CleaningConfig.workers, which uses processes.
+        
+        With batch_size, rows are analyzed that many at a time. The report
+        is the same, but no single column pass holds the GIL for the whole
+        dataset, which keeps other threads such as a GUI responsive.
+        """
         if data is None:
             data = self.data
-            
-        if not data:
-            return {"error": "No data to analyze"}
         
-        report = {
-            "total_rows": len(data),
-            "total_columns": len(data[0].keys()) if data else 0,
-            "missing_values": self._find_missing_values(data),
-            "duplicates": self._find_duplicate_rows(data),
-            "date_issues": self._find_date_issues(data),
-            "whitespace_issues": self._find_whitespace_issues(data),
-            "case_inconsistencies": self._find_case_inconsistencies(data)
-        }
+        detector = IssueDetector()
+        if batch_size:
+            for start in range(0, len(data), batch_size):
+                detector.update(data[start:start + batch_size])
+        else:
+            detector.update(data)
+        report = detector.report()
         
         self.issues_report = report
         return report
+
+
+class IssueDetector:
+    """Accumulates data quality issues over one or more batches of rows."""
     
-    def _find_missing_values(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Find missing values in the dataset."""
-        missing_report = {}
-        
+    DATE_PATTERNS = [
+        r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
+        r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
+        r'\d{1,2}/\d{1,2}/\d{4}',  # M/D/YYYY
+        r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
+    ]
+    _DATE_REGEXES = [re.compile(pattern) for pattern in DATE_PATTERNS]
+    
+    def __init__(self):
+        self.total_rows = 0
+        self.columns: List[str] = []
+        self.missing_counts: Dict[str, int] = {}
+        self.seen_rows: Dict[tuple, set] = {}  # sorted column names -> hashes of row values
+        self.duplicate_indices: List[int] = []
+        self.date_formats: Dict[str, set] = {}
+        self.whitespace_counts: Dict[str, int] = {}
+        self.case_groups: Dict[str, Dict[str, set]] = {}
+    
+    def update(self, data: List[Dict[str, Any]]) -> None:
+        """Add a batch of rows to the analysis."""
         if not data:
-            return missing_report
-            
-        columns = data[0].keys()
+            return
         
-        for column in columns:
-            missing_count = 0
-            for row in data:
-                value = row.get(column, "")
-                if value is None or str(value).strip() in ["", "null", "NULL", "None", "N/A", "n/a"]:
-                    missing_count += 1
-            
+        if not self.total_rows:
+            # Columns are taken from the first row of the first batch
+            self._start(list(data[0].keys()))
+        
+        columns = rows_to_columns(data, self.columns)
+        
+        header = tuple(self.columns)
+        if header and set(map(tuple, data)) == {header}:
+            # Every row has the first batch's columns, so the transposed
+            # lists already hold each row's values
+            self._find_duplicate_values(columns)
+        else:
+            self._find_duplicate_rows(data)
+        self._scan_columns(columns)
+        
+        self.total_rows += len(data)
+    
+    def update_columns(self, columns: Dict[str, List[Any]]) -> None:
+        """Add a batch already split into columns, with every row holding every column."""
+        row_count = len(next(iter(columns.values()), []))
+        if not row_count:
+            return
+        
+        if not self.total_rows:
+            self._start(list(columns))
+        
+        self._find_duplicate_values(columns)
+        self._scan_columns({column: columns.get(column, [""] * row_count) for column in self.columns})
+        
+        self.total_rows += row_count
+    
+    def _start(self, columns: List[str]) -> None:
+        """Set up counters for the columns of the first batch."""
+        self.columns = columns
+        for column in self.columns:
+            self.missing_counts[column] = 0
+            self.date_formats[column] = set()
+            self.whitespace_counts[column] = 0
+            self.case_groups[column] = {}
+    
+    def _scan_columns(self, columns: Dict[str, List[Any]]) -> None:
+        """Run the per-column checks over one batch."""
+        self._find_missing_values(columns)
+        self._find_date_issues(columns)
+        self._find_whitespace_issues(columns)
+        self._find_case_inconsistencies(columns)
+    
+    def report(self) -> Dict[str, Any]:
+        """Build the issues report for all rows seen so far."""
+        if not self.total_rows:
+            return {"error": "No data to analyze"}
+        
+        total_rows = self.total_rows
+        
+        missing_report = {}
+        for column, missing_count in self.missing_counts.items():
             if missing_count > 0:
                 missing_report[column] = {
                     "count": missing_count,
-                    "percentage": round((missing_count / len(data)) * 100, 2)
+                    "percentage": round((missing_count / total_rows) * 100, 2)
                 }
         
-        return missing_report
-    
-    def _find_duplicate_rows(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Find duplicate rows in the dataset."""
-        if not data:
-            return {"count": 0, "indices": []}
-            
-        seen = set()
-        duplicates = []
-        
-        for i, row in enumerate(data):
-            # Convert row to tuple for hashing
-            row_tuple = tuple(sorted(row.items()))
-            if row_tuple in seen:
-                duplicates.append(i)
-            else:
-                seen.add(row_tuple)
-        
-        return {
+        duplicates = self.duplicate_indices
+        duplicates_report = {
             "count": len(duplicates),
-            "indices": duplicates,
-            "percentage": round((len(duplicates) / len(data)) * 100, 2) if data else 0
+            "indices": list(duplicates),
+            "percentage": round((len(duplicates) / total_rows) * 100, 2)
         }
-    
-    def _find_date_issues(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Find inconsistent date formats."""
-        date_issues = {}
         
-        if not data:
-            return date_issues
-        
-        columns = data[0].keys()
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            r'\d{1,2}/\d{1,2}/\d{4}',  # M/D/YYYY
-            r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
-        ]
-        
-        for column in columns:
-            formats_found = set()
-            for row in data:
-                value = str(row.get(column, "")).strip()
-                if value:
-                    for pattern in date_patterns:
-                        if re.match(pattern, value):
-                            formats_found.add(pattern)
-            
+        date_issues = {}
+        for column, formats_found in self.date_formats.items():
             if len(formats_found) > 1:
                 date_issues[column] = {
                     "formats_found": len(formats_found),
                     "patterns": list(formats_found)
                 }
         
-        return date_issues
-    
-    def _find_whitespace_issues(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Find whitespace issues in data."""
         whitespace_issues = {}
-        
-        if not data:
-            return whitespace_issues
-        
-        columns = data[0].keys()
-        
-        for column in columns:
-            issues_count = 0
-            for row in data:
-                value = row.get(column, "")
-                if isinstance(value, str):
-                    if value != value.strip():
-                        issues_count += 1
-            
+        for column, issues_count in self.whitespace_counts.items():
             if issues_count > 0:
                 whitespace_issues[column] = {
                     "count": issues_count,
-                    "percentage": round((issues_count / len(data)) * 100, 2)
+                    "percentage": round((issues_count / total_rows) * 100, 2)
                 }
         
-        return whitespace_issues
-    
-    def _find_case_inconsistencies(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Find case inconsistencies in string data."""
         case_issues = {}
+        for column, lower_values in self.case_groups.items():
+            inconsistencies = (k for k, v in lower_values.items() if len(v) > 1)
+            
+            # Show first 3 examples; only those groups are copied into lists
+            examples = {k: list(lower_values[k]) for k in islice(inconsistencies, 3)}
+            if examples:
+                case_issues[column] = {
+                    "inconsistent_groups": len(examples) + sum(1 for _ in inconsistencies),
+                    "examples": examples
+                }
         
-        if not data:
-            return case_issues
-        
-        columns = data[0].keys()
+        return {
+            "total_rows": total_rows,
+            "total_columns": len(self.columns),
+            "missing_values": missing_report,
+            "duplicates": duplicates_report,
+            "date_issues": date_issues,
+            "whitespace_issues": whitespace_issues,
+            "case_inconsistencies": case_issues
+        }
+    
+    def _find_missing_values(self, columns: Dict[str, List[Any]]) -> None:
+        """Count missing values in the batch."""
+        for column, values in columns.items():
+            missing_count = 0
+            for value in values:
+                if value is None or str(value).strip() in _MISSING_MARKERS:
+                    missing_count += 1
+            
+            self.missing_counts[column] += missing_count
+    
+    def _find_duplicate_values(self, columns: Dict[str, List[Any]]) -> None:
+        """Find repeated rows in a batch where every row holds every column."""
+        # Rows are keyed by their values in sorted column order, so batches
+        # with a different column order or from _find_duplicate_rows match.
+        # Only the 64-bit hash of each row is kept: this is a report, so a
+        # collision costs one miscounted row, while whole tuples would keep
+        # every distinct row's values alive for the rest of the scan
+        names = sorted(columns)
+        seen = self.seen_rows.setdefault(tuple(names), set())
+        add = seen.add
+        duplicates = self.duplicate_indices
         
-        for column in columns:
-            values = set()
-            for row in data:
-                value = row.get(column, "")
-                if isinstance(value, str) and value.strip():
-                    values.add(value.strip())
+        row_hashes = map(hash, zip(*(columns[name] for name in names)))
+        for i, row_hash in enumerate(row_hashes, self.total_rows):
+            if row_hash in seen:
+                duplicates.append(i)
+            else:
+                add(row_hash)
+    
+    def _find_duplicate_rows(self, data: List[Dict[str, Any]]) -> None:
+        """Find rows that repeat an earlier row."""
+        # Rows with the same keys in the same order share one sort and one
+        # getter for their values in sorted column order
+        layouts: Dict[tuple, tuple] = {}
+        for i, row in enumerate(data, self.total_rows):
+            keys = tuple(row)
+            layout = layouts.get(keys)
+            if layout is None:
+                names = tuple(sorted(keys))
+                if len(names) > 1:
+                    getter = itemgetter(*names)
+                else:
+                    # itemgetter returns a bare value for one name, not a tuple
+                    getter = lambda row, names=names: tuple(row[name] for name in names)
+                layout = layouts[keys] = (getter, self.seen_rows.setdefault(names, set()))
+            getter, seen = layout
+            row_hash = hash(getter(row))
+            if row_hash in seen:
+                self.duplicate_indices.append(i)
+            else:
+                seen.add(row_hash)
+    
+    def _find_date_issues(self, columns: Dict[str, List[Any]]) -> None:
+        """Collect the date formats used in each column."""
+        regexes = self._DATE_REGEXES
+        for column, values in columns.items():
+            formats_found = self.date_formats[column]
+            if len(formats_found) == len(regexes):
+                continue
             
-            # Check for case variations of the same word
-            lower_values = {}
+            # Every pattern spans at least eight characters, starts with a
+            # digit and has its first separator at index 1, 2 or 4, so only
+            # values shaped like that reach the regexes, each of them once
+            candidates = {
+                value for value in map(str.strip, map(str, values))
+                if len(value) >= 8 and value[0].isdecimal()
+                and (value[4] == "-" or value[2] in "-/" or value[1] == "/")
+            }
+            for value in candidates:
+                for regex in regexes:
+                    if regex.match(value):
+                        formats_found.add(regex.pattern)
+    
+    def _find_whitespace_issues(self, columns: Dict[str, List[Any]]) -> None:
+        """Count values with leading or trailing whitespace."""
+        for column, values in columns.items():
+            issues_count = 0
             for value in values:
-                lower_val = value.lower()
-                if lower_val not in lower_values:
-                    lower_values[lower_val] = []
-                lower_values[lower_val].append(value)
+                if isinstance(value, str):
+                    if value != value.strip():
+                        issues_count += 1
             
-            inconsistencies = {k: v for k, v in lower_values.items() if len(v) > 1}
+            self.whitespace_counts[column] += issues_count
+    
+    def _find_case_inconsistencies(self, columns: Dict[str, List[Any]]) -> None:
+        """Group string values that differ only by case."""
+        for column, column_values in columns.items():
+            # Strip each distinct string once, then group by lowercase form
+            strings = set(compress(column_values, map(isinstance, column_values, repeat(str))))
+            stripped = set(map(str.strip, strings))
+            stripped.discard("")
             
-            if inconsistencies:
-                case_issues[column] = {
-                    "inconsistent_groups": len(inconsistencies),
-                    "examples": dict(list(inconsistencies.items())[:3])  # Show first 3 examples
-                }
-        
-        return case_issues
\ No newline at end of file
+            # Check for case variations of the same word
+            lower_values = self.case_groups[column]
+            for value in stripped:
+                lower_val = value.lower()
+                group = lower_values.get(lower_val)
+                if group is None:
+                    lower_values[lower_val] = {value}
+                else:
+                    group.add(value)
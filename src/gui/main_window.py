@@ -6,9 +6,10 @@ Tkinter-based graphical interface for DataMender.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import queue
 import os
 import sys
-from pathlib import Path
+from itertools import islice
 from typing import Optional, Dict, Any
 
 # Add parent directory to path for imports
@@ -16,6 +17,27 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from data_processor import DataProcessor, DataMenderError
 from data_cleaner import DataCleaner, CleaningConfig
+from table_utils import rows_to_columns
+
+# Rows analyzed or written per pass in worker threads. Each pass holds the
+# GIL until it finishes, so smaller batches keep the window responsive.
+_WORKER_BATCH_ROWS = 20000
+
+# Issues report sections in display order: report key, heading when issues
+# were found, line per column (None for a one-line summary), and the line
+# shown when there were none. Headings get the number of columns as count.
+_REPORT_SECTIONS = (
+    ("missing_values", "Missing values found in {count} columns:",
+     "  • {column}: {count} missing ({percentage:.1f}%)", "✓ No missing values found"),
+    ("duplicates", "⚠ Found {count} duplicate rows ({percentage:.1f}%)",
+     None, "✓ No duplicate rows found"),
+    ("date_issues", "Date format inconsistencies in {count} columns:",
+     "  • {column}: {formats_found} different formats", "✓ No date format issues found"),
+    ("whitespace_issues", "Whitespace issues in {count} columns:",
+     "  • {column}: {count} values ({percentage:.1f}%)", "✓ No whitespace issues found"),
+    ("case_inconsistencies", "Case inconsistencies in {count} columns:",
+     "  • {column}: {inconsistent_groups} groups with variations", "✓ No case inconsistencies found"),
+)
 
 
 class DataMenderGUI:
@@ -25,11 +47,26 @@ class DataMenderGUI:
         self.root = tk.Tk()
         self.processor = DataProcessor()
         self.cleaner = DataCleaner()
+        # Previews run on the Tk thread, so they get their own cleaner rather
+        # than resetting the statistics of a cleaning run in progress
+        self._preview_cleaner = DataCleaner()
         
         self.input_file = ""
         self.output_file = ""
         self.current_data = []
+        self._columns = ()  # Column names of the loaded data's first row
         self.issues_report = {}
+        self._rendered_report = None
+        self._pending_status = None
+        self._path_check_id = None
+        
+        # Worker threads never touch widgets; they post (tag, *args)
+        # messages here and _pump_ui_queue handles them on the Tk thread
+        self._ui_queue = queue.Queue()
+        # Background operations run one at a time, in click order, on a
+        # single daemon thread, so closing the window never waits for them
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._run_jobs, name="datamender-worker", daemon=True).start()
         
         self.setup_ui()
         
@@ -53,6 +90,44 @@ class DataMenderGUI:
         self.status_var = tk.StringVar(value="Ready")
         self.status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        self.root.after(50, self._pump_ui_queue)
+    
+    def _pump_ui_queue(self):
+        """Handle messages posted by worker threads, then check again shortly."""
+        handlers = {
+            "status": self.update_status,
+            "loaded": self.on_data_loaded,
+            "cleaned": self.on_cleaning_complete,
+            "error": self.on_worker_error,
+        }
+        try:
+            while True:
+                tag, *args = self._ui_queue.get_nowait()
+                handlers[tag](*args)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(50, self._pump_ui_queue)
+    
+    def _run_jobs(self):
+        """Run queued background operations for the life of the process."""
+        while True:
+            job = self._jobs.get()
+            job()
+    
+    def create_output_text(self, parent: ttk.Frame, **options) -> scrolledtext.ScrolledText:
+        """Create a read-only text area with vertical and horizontal scrollbars."""
+        # The text is always replaced as a whole, so no undo history is kept,
+        # and long lines scroll sideways instead of being re-wrapped
+        text = scrolledtext.ScrolledText(parent, wrap=tk.NONE, undo=False, autoseparators=False,
+                                         maxundo=0, state=tk.DISABLED, **options)
+        x_scroll = ttk.Scrollbar(parent, orient=tk.HORIZONTAL, command=text.xview)
+        text.configure(xscrollcommand=x_scroll.set)
+        
+        x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        text.pack(fill=tk.BOTH, expand=True)
+        return text
     
     def create_file_tab(self):
         """Create file input/output tab."""
@@ -93,8 +168,7 @@ class DataMenderGUI:
         info_frame = ttk.LabelFrame(tab, text="File Information", padding=10)
         info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
         
-        self.file_info_text = scrolledtext.ScrolledText(info_frame, height=10, state=tk.DISABLED)
-        self.file_info_text.pack(fill=tk.BOTH, expand=True)
+        self.file_info_text = self.create_output_text(info_frame, height=10)
         
         # Bind file path changes
         self.input_var.trace('w', self.on_file_paths_changed)
@@ -109,8 +183,7 @@ class DataMenderGUI:
         results_frame = ttk.LabelFrame(tab, text="Data Quality Report", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        self.analysis_text = scrolledtext.ScrolledText(results_frame, state=tk.DISABLED)
-        self.analysis_text.pack(fill=tk.BOTH, expand=True)
+        self.analysis_text = self.create_output_text(results_frame)
         
         # Refresh button
         button_frame = ttk.Frame(tab)
@@ -230,8 +303,7 @@ class DataMenderGUI:
         results_frame = ttk.LabelFrame(tab, text="Cleaning Results", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
         
-        self.results_text = scrolledtext.ScrolledText(results_frame, state=tk.DISABLED)
-        self.results_text.pack(fill=tk.BOTH, expand=True)
+        self.results_text = self.create_output_text(results_frame)
         
         # Action buttons
         button_frame = ttk.Frame(tab)
@@ -251,6 +323,8 @@ class DataMenderGUI:
             filetypes=[
                 ("CSV files", "*.csv"),
                 ("JSON files", "*.json"),
+                ("Parquet files", "*.parquet"),
+                ("Arrow files", "*.arrow"),
                 ("All files", "*.*")
             ]
         )
@@ -265,6 +339,8 @@ class DataMenderGUI:
             filetypes=[
                 ("CSV files", "*.csv"),
                 ("JSON files", "*.json"),
+                ("Parquet files", "*.parquet"),
+                ("Arrow files", "*.arrow"),
                 ("All files", "*.*")
             ]
         )
@@ -272,40 +348,50 @@ class DataMenderGUI:
             self.output_var.set(filename)
     
     def on_file_paths_changed(self, *args):
+        """Check the file paths once typing has paused."""
+        # The trace fires on every keystroke; only the last change within
+        # the delay reaches the filesystem
+        if self._path_check_id is not None:
+            self.root.after_cancel(self._path_check_id)
+        self._path_check_id = self.root.after(150, self.check_file_paths)
+    
+    def check_file_paths(self):
         """Enable/disable load button based on file paths."""
+        self._path_check_id = None
         input_file = self.input_var.get().strip()
         output_file = self.output_var.get().strip()
         
-        if input_file and output_file and Path(input_file).exists():
+        if input_file and output_file and os.path.isfile(input_file):
             self.load_button.config(state=tk.NORMAL)
         else:
             self.load_button.config(state=tk.DISABLED)
     
     def load_data_async(self):
         """Load data in background thread."""
+        self.update_status("Loading data...")
+        self.load_button.config(state=tk.DISABLED)
+        input_file = self.input_var.get()
+        
         def load_worker():
             try:
-                self.update_status("Loading data...")
-                self.load_button.config(state=tk.DISABLED)
+                data = self.processor.load_data(input_file)
                 
-                # Load data
-                self.current_data = self.processor.load_data(self.input_var.get())
+                self._ui_queue.put(("status", "Analyzing data..."))
+                report = self.processor.detect_issues(data, batch_size=_WORKER_BATCH_ROWS)
                 
-                # Analyze data
-                self.update_status("Analyzing data...")
-                self.issues_report = self.processor.detect_issues(self.current_data)
-                
-                # Update UI on main thread
-                self.root.after(0, self.on_data_loaded)
+                self._ui_queue.put(("loaded", data, report))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.show_error(f"Error loading data: {e}"))
-                self.root.after(0, lambda: self.load_button.config(state=tk.NORMAL))
+                self._ui_queue.put(("error", f"Error loading data: {e}", self.load_button))
         
-        threading.Thread(target=load_worker, daemon=True).start()
+        self._jobs.put(load_worker)
     
-    def on_data_loaded(self):
+    def on_data_loaded(self, data: list, report: Dict[str, Any]):
         """Handle successful data loading."""
+        self.current_data = data
+        self._columns = tuple(data[0]) if data else ()
+        self.issues_report = report
+        
         # Update file info
         self.update_file_info()
         
@@ -331,9 +417,9 @@ class DataMenderGUI:
         info = f"File: {self.input_var.get()}\n"
         info += f"Rows: {len(self.current_data):,}\n"
         if self.current_data:
-            info += f"Columns: {len(self.current_data[0].keys())}\n\n"
+            info += f"Columns: {len(self._columns)}\n\n"
             info += "Column Names:\n"
-            for i, col in enumerate(self.current_data[0].keys(), 1):
+            for i, col in enumerate(self._columns, 1):
                 info += f"{i:2d}. {col}\n"
         
         self.file_info_text.insert(1.0, info)
@@ -341,96 +427,66 @@ class DataMenderGUI:
     
     def update_analysis_display(self):
         """Update analysis results display."""
-        self.analysis_text.config(state=tk.NORMAL)
-        self.analysis_text.delete(1.0, tk.END)
+        # The rendered text is kept with the report it came from, so showing
+        # the same report again skips formatting and the widget update
+        if self.issues_report is self._rendered_report:
+            return
         
         report = self.format_issues_report(self.issues_report)
-        self.analysis_text.insert(1.0, report)
+        self.analysis_text.config(state=tk.NORMAL)
+        self.analysis_text.replace(1.0, tk.END, report)
         self.analysis_text.config(state=tk.DISABLED)
+        self._rendered_report = self.issues_report
     
     def format_issues_report(self, report: Dict[str, Any]) -> str:
         """Format issues report for display."""
-        output = "DATA QUALITY REPORT\n"
-        output += "=" * 50 + "\n\n"
-        
-        output += f"Total rows: {report.get('total_rows', 0):,}\n"
-        output += f"Total columns: {report.get('total_columns', 0)}\n\n"
-        
-        # Missing values
-        missing = report.get('missing_values', {})
-        if missing:
-            output += f"Missing values found in {len(missing)} columns:\n"
-            for column, info in missing.items():
-                output += f"  • {column}: {info['count']} missing ({info['percentage']:.1f}%)\n"
-        else:
-            output += "✓ No missing values found\n"
-        output += "\n"
-        
-        # Duplicates
-        duplicates = report.get('duplicates', {})
-        if duplicates.get('count', 0) > 0:
-            output += f"⚠ Found {duplicates['count']} duplicate rows ({duplicates['percentage']:.1f}%)\n"
-        else:
-            output += "✓ No duplicate rows found\n"
-        output += "\n"
-        
-        # Date issues
-        date_issues = report.get('date_issues', {})
-        if date_issues:
-            output += f"Date format inconsistencies in {len(date_issues)} columns:\n"
-            for column, info in date_issues.items():
-                output += f"  • {column}: {len(info['formats_found'])} different formats\n"
-        else:
-            output += "✓ No date format issues found\n"
-        output += "\n"
-        
-        # Whitespace issues
-        whitespace = report.get('whitespace_issues', {})
-        if whitespace:
-            output += f"Whitespace issues in {len(whitespace)} columns:\n"
-            for column, info in whitespace.items():
-                output += f"  • {column}: {info['count']} values ({info['percentage']:.1f}%)\n"
-        else:
-            output += "✓ No whitespace issues found\n"
-        output += "\n"
-        
-        # Case inconsistencies
-        case_issues = report.get('case_inconsistencies', {})
-        if case_issues:
-            output += f"Case inconsistencies in {len(case_issues)} columns:\n"
-            for column, info in case_issues.items():
-                output += f"  • {column}: {info['inconsistent_groups']} groups with variations\n"
-        else:
-            output += "✓ No case inconsistencies found\n"
-        
-        return output
+        parts = ["DATA QUALITY REPORT", "=" * 50, ""]
+        
+        parts.append(f"Total rows: {report.get('total_rows', 0):,}")
+        parts.append(f"Total columns: {report.get('total_columns', 0)}")
+        parts.append("")
+        
+        for key, heading, line_format, none_found in _REPORT_SECTIONS:
+            section = report.get(key, {})
+            if line_format is None:
+                # A single summary line rather than one line per column
+                if section.get('count', 0) > 0:
+                    parts.append(heading.format_map(section))
+                else:
+                    parts.append(none_found)
+            elif section:
+                parts.append(heading.format(count=len(section)))
+                for column, info in section.items():
+                    parts.append(line_format.format(column=column, **info))
+            else:
+                parts.append(none_found)
+            parts.append("")
+        
+        # The blank line after the last section ends it with a newline
+        return "\n".join(parts)
     
     def refresh_analysis(self):
         """Refresh data analysis."""
         if not self.current_data:
             return
         
-        def refresh_worker():
-            try:
-                self.update_status("Refreshing analysis...")
-                self.issues_report = self.processor.detect_issues(self.current_data)
-                self.root.after(0, self.update_analysis_display)
-                self.root.after(0, lambda: self.update_status("Analysis refreshed"))
-            except Exception as e:
-                self.root.after(0, lambda: self.show_error(f"Error refreshing analysis: {e}"))
-        
-        threading.Thread(target=refresh_worker, daemon=True).start()
+        # current_data only changes on load, which analyzes it, and cleaning
+        # writes to the output file, so the report from loading still holds
+        self.update_analysis_display()
+        self.update_status("Analysis is up to date")
     
     def create_cleaning_config(self) -> CleaningConfig:
         """Create cleaning configuration from GUI settings."""
+        # Each Tk variable read is a round trip into Tcl, so every one is read once
+        fill_missing = self.fill_missing_var.get()
         fill_defaults = {}
-        if self.fill_missing_var.get():
+        if fill_missing:
             fill_defaults["_default"] = self.fill_default_var.get()
         
         return CleaningConfig(
             remove_duplicates=self.remove_duplicates_var.get(),
             trim_whitespace=self.trim_whitespace_var.get(),
-            fill_missing=self.fill_missing_var.get(),
+            fill_missing=fill_missing,
             fill_defaults=fill_defaults,
             standardize_dates=self.standardize_dates_var.get(),
             date_format=self.date_format_var.get(),
@@ -446,10 +502,9 @@ class DataMenderGUI:
         
         config = self.create_cleaning_config()
         
-        # Apply to sample
-        sample_size = min(5, len(self.current_data))
-        sample_data = self.current_data[:sample_size]
-        cleaned_sample = self.cleaner.clean_data(sample_data, config)
+        # Apply to sample; islice needs only an iterable, not a sized list
+        sample_data = list(islice(self.current_data, 5))
+        cleaned_sample = self._preview_cleaner.clean_data(sample_data, config)
         
         # Show preview window
         self.show_preview_window(sample_data, cleaned_sample)
@@ -467,71 +522,78 @@ class DataMenderGUI:
         # Before tab
         before_frame = ttk.Frame(notebook)
         notebook.add(before_frame, text="Before")
-        before_text = scrolledtext.ScrolledText(before_frame)
-        before_text.pack(fill=tk.BOTH, expand=True)
-        before_text.insert(1.0, self.format_data_sample(original))
-        before_text.config(state=tk.DISABLED)
+        self.create_sample_table(before_frame, original, self._columns)
         
         # After tab
         after_frame = ttk.Frame(notebook)
         notebook.add(after_frame, text="After")
-        after_text = scrolledtext.ScrolledText(after_frame)
-        after_text.pack(fill=tk.BOTH, expand=True)
-        after_text.insert(1.0, self.format_data_sample(cleaned))
-        after_text.config(state=tk.DISABLED)
+        self.create_sample_table(after_frame, cleaned)
         
         # Close button
         ttk.Button(preview_window, text="Close", 
                   command=preview_window.destroy).pack(pady=10)
     
-    def format_data_sample(self, data: list) -> str:
-        """Format data sample for display."""
+    def create_sample_table(self, parent: ttk.Frame, data: list, columns: Optional[tuple] = None):
+        """Show rows in a scrollable table, by default with the first row's columns."""
         if not data:
-            return "(No data)"
-        
-        # Get column names
-        columns = list(data[0].keys())
-        
-        # Create formatted table
-        output = "Sample Data (first 5 rows):\n"
-        output += "=" * 50 + "\n\n"
-        
-        # Header
-        header = " | ".join(f"{col[:15]:15}" for col in columns)
-        output += header + "\n"
-        output += "-" * len(header) + "\n"
-        
-        # Rows
-        for row in data:
-            row_str = " | ".join(
-                f"{str(row.get(col, ''))[:15]:15}" for col in columns
-            )
-            output += row_str + "\n"
+            ttk.Label(parent, text="(No data)").pack(anchor=tk.NW, padx=5, pady=5)
+            return
         
-        return output
+        if columns is None:
+            columns = tuple(data[0])
+        # Positional ids, so any column name can be shown as a heading
+        column_ids = [f"c{i}" for i in range(len(columns))]
+        
+        tree = ttk.Treeview(parent, columns=column_ids, show="headings")
+        y_scroll = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=tree.yview)
+        x_scroll = ttk.Scrollbar(parent, orient=tk.HORIZONTAL, command=tree.xview)
+        tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        
+        for column_id, col in zip(column_ids, columns):
+            tree.heading(column_id, text=col, anchor=tk.W)
+            # Fixed widths let wide tables scroll sideways instead of squeezing
+            tree.column(column_id, width=120, minwidth=40, stretch=False, anchor=tk.W)
+        
+        cells = rows_to_columns(data, columns)
+        for values in zip(*(map(str, cells[col]) for col in columns)):
+            tree.insert("", tk.END, values=values)
+        
+        tree.grid(row=0, column=0, sticky="nsew")
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        parent.rowconfigure(0, weight=1)
+        parent.columnconfigure(0, weight=1)
     
     def apply_cleaning_async(self):
         """Apply cleaning operations in background thread."""
+        self.update_status("Applying cleaning operations...")
+        self.apply_button.config(state=tk.DISABLED)
+        
+        # Tk variables are read here, on the Tk thread
+        config = self.create_cleaning_config()
+        output_file = self.output_var.get()
+        data = self.current_data
+        
         def clean_worker():
             try:
-                self.update_status("Applying cleaning operations...")
-                self.apply_button.config(state=tk.DISABLED)
-                
-                config = self.create_cleaning_config()
-                cleaned_data = self.cleaner.clean_data(self.current_data, config)
+                cleaned_data = self.cleaner.clean_data(data, config)
                 stats = self.cleaner.get_cleaning_stats()
                 
-                # Save results
-                self.processor.save_data(self.output_var.get(), cleaned_data)
+                # Save results. Parquet and Arrow files get one batch, since
+                # save_batches writes every column as text once there are more
+                if os.path.splitext(output_file)[1].lower() in ('.parquet', '.arrow'):
+                    self.processor.save_data(output_file, cleaned_data)
+                else:
+                    batches = (cleaned_data[start:start + _WORKER_BATCH_ROWS]
+                               for start in range(0, len(cleaned_data), _WORKER_BATCH_ROWS))
+                    self.processor.save_batches(output_file, batches)
                 
-                # Update UI on main thread
-                self.root.after(0, lambda: self.on_cleaning_complete(stats))
+                self._ui_queue.put(("cleaned", stats))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.show_error(f"Error applying cleaning: {e}"))
-                self.root.after(0, lambda: self.apply_button.config(state=tk.NORMAL))
+                self._ui_queue.put(("error", f"Error applying cleaning: {e}", self.apply_button))
         
-        threading.Thread(target=clean_worker, daemon=True).start()
+        self._jobs.put(clean_worker)
     
     def on_cleaning_complete(self, stats: Dict[str, Any]):
         """Handle successful cleaning completion."""
@@ -598,14 +660,28 @@ class DataMenderGUI:
     
     def update_status(self, message: str):
         """Update status bar message."""
-        self.status_var.set(message)
-        self.root.update_idletasks()
+        # Messages set before Tk next goes idle share one update, which
+        # shows the latest of them
+        if self._pending_status is None:
+            self.root.after_idle(self._apply_status)
+        self._pending_status = message
+    
+    def _apply_status(self):
+        """Show the most recent status message."""
+        self.status_var.set(self._pending_status)
+        self._pending_status = None
     
     def show_error(self, message: str):
         """Show error message dialog."""
         messagebox.showerror("Error", message)
         self.update_status("Error occurred")
     
+    def on_worker_error(self, message: str, button: Optional[ttk.Button]):
+        """Report a failed background operation and re-enable its button."""
+        self.show_error(message)
+        if button is not None:
+            button.config(state=tk.NORMAL)
+    
     def run(self):
         """Run the GUI application."""
         # Center window on screen
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+DataMender - Table Helpers
+Small helpers for working with rows as per-column value lists.
+"""
+
+from itertools import repeat
+from typing import List, Dict, Any, Iterable
+
+
+def rows_to_columns(rows: List[Dict[str, Any]], columns: Iterable[str]) -> Dict[str, List[Any]]:
+    """Collect each column's values across the rows, using "" for missing keys."""
+    # map() over dict.get does the per-row lookups in C
+    return {column: list(map(dict.get, rows, repeat(column), repeat(""))) for column in columns}
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+DataMender - Data Cleaner Tests
+Run with: python -m unittest discover tests
+"""
+
+import os
+import random
+import sys
+import unittest
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_cleaner import DataCleaner, CleaningConfig, _clean_column_steps, _DATE_PATTERNS, _DATE_OUTPUT_FORMATS
+from data_processor import DataMenderError
+
+
+class DistinctPassStatsTest(unittest.TestCase):
+    """The distinct-value pass must count changes like the row-wise path."""
+
+    COLUMN = ["", "", "", "null", " N/A ", "Bob", " bob ", "BOB", "", "2023-01-05", "1/5/2023"] * 5
+
+    def row_wise_counts(self, steps):
+        """Run each step over every value on its own and add up the counts."""
+        values = list(self.COLUMN)
+        counts = []
+        for step in steps:
+            count = 0
+            for i, value in enumerate(values):
+                cell = [value]
+                count += step(cell, "name")
+                values[i] = cell[0]
+            counts.append(count)
+        return values, counts
+
+    def check_steps(self, steps):
+        expected_values, expected_counts = self.row_wise_counts(steps)
+
+        values = list(self.COLUMN)
+        counts = _clean_column_steps(values, "name", steps)
+
+        self.assertEqual(values, expected_values)
+        self.assertEqual(counts, expected_counts)
+
+    def test_fill_with_empty_default_counts_every_missing_cell(self):
+        cleaner = DataCleaner()
+        self.check_steps([lambda values, key: cleaner._fill_missing_values(values, key, {})])
+
+    def test_all_steps_in_one_pass(self):
+        cleaner = DataCleaner()
+        self.check_steps([
+            cleaner._trim_whitespace,
+            lambda values, key: cleaner._fill_missing_values(values, key, {"_default": "X"}),
+            lambda values, key: cleaner._standardize_dates(values, key, "ISO"),
+            lambda values, key: cleaner._normalize_case(values, key, "title"),
+        ])
+
+    def test_clean_data_reports_filled_cells(self):
+        data = [{"name": value} for value in self.COLUMN]
+        cleaner = DataCleaner()
+        cleaner.clean_data(data, CleaningConfig(fill_missing=True))
+
+        missing = sum(1 for value in self.COLUMN if cleaner._is_missing_value(value))
+        self.assertEqual(cleaner.get_cleaning_stats()["missing_values_filled"], missing)
+
+
+class DedupSubsetTest(unittest.TestCase):
+    """Unknown --dedup-subset columns must be rejected, not match every row."""
+
+    DATA = [{"name": "a", "email": "x"}, {"name": "b", "email": "y"}]
+
+    def test_unknown_column_raises(self):
+        config = CleaningConfig(remove_duplicates=True, dedup_subset=["emial"])
+        with self.assertRaisesRegex(DataMenderError, "emial"):
+            DataCleaner().clean_data([dict(row) for row in self.DATA], config)
+
+    def test_known_column_keeps_distinct_rows(self):
+        config = CleaningConfig(remove_duplicates=True, dedup_subset=["email"])
+        self.assertEqual(len(DataCleaner().clean_data([dict(row) for row in self.DATA], config)), 2)
+
+
+class DuplicateMemoryTest(unittest.TestCase):
+    """clean_data must not keep row keys alive once it returns."""
+
+    DATA = [{"name": "a", "email": "x"}, {"name": "a", "email": "x"}, {"name": "b", "email": "x"}]
+
+    def check_forgets_rows(self, subset):
+        cleaner = DataCleaner()
+        config = CleaningConfig(remove_duplicates=True, dedup_subset=subset)
+        cleaned = cleaner.clean_data([dict(row) for row in self.DATA], config)
+        self.assertEqual(len(cleaned), 3 - cleaner.get_cleaning_stats()["duplicates_removed"])
+        self.assertEqual(cleaner._seen_rows, {})
+
+    def test_whole_rows(self):
+        self.check_forgets_rows([])
+
+    def test_subset(self):
+        self.check_forgets_rows(["email"])
+
+    def test_batches_remember_rows(self):
+        cleaner = DataCleaner()
+        config = CleaningConfig(remove_duplicates=True)
+        cleaner.clean_batch([dict(self.DATA[0])], config)
+        self.assertEqual(cleaner.clean_batch([dict(self.DATA[1])], config), [])
+
+
+class CompiledDatesTest(unittest.TestCase):
+    """The optional Cython date kernel must match _convert_date exactly."""
+
+    VALUES = [
+        "2023-01-05", "2023-1-5", "1/5/2023", "01/05/2023", "2023/01/05", "05-01-2023",
+        "05.01.2023", "1/5/23", "1/5/68", "1/5/69", "2024-02-29", "2023-02-29", "1900-02-29",
+        "2000-02-29", "2023-04-31", "2023-13-01", "2023-00-10", "2023-01-00", "0999-01-01",
+        "0001-12-31", "12/31/0050", " 2023-01-05 ", "\t1/5/2023\n", "2023-01-05\n",
+        "2023-01-5x", "20230105", "2023--01-05", "1/5/2023/", "123/4/2023", "1.5.23",
+        "\u0662\u0660\u0662\u0663-\u0660\u0661-\u0660\u0665", "\uff12\uff10\uff12\uff13-01-05",
+        "2023-01-0\u00b2", "", "   ", "null", "Bob", "2023", "99999-01-01", None, 5, 2.5,
+    ]
+
+    def setUp(self):
+        try:
+            from _fastdates import standardize_date_column
+        except ImportError:
+            self.skipTest("the compiled _fastdates extension is not built")
+        self.kernel = standardize_date_column
+
+        rng = random.Random(0)
+        alphabet = "0123456789/-. \u0663"
+        self.values = self.VALUES + ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 11)))
+                                     for _ in range(5000)]
+
+    def test_matches_convert_date_for_every_format(self):
+        cleaner = DataCleaner()
+        for target_format in list(_DATE_OUTPUT_FORMATS) + ["iso", "us", "eu", "other"]:
+            with self.subTest(target_format=target_format):
+                convert = partial(cleaner._convert_date, patterns=_DATE_PATTERNS, target_format=target_format)
+                expected = [convert(value.strip()) if isinstance(value, str) and value.strip() else value
+                            for value in self.values]
+
+                values = list(self.values)
+                changed = self.kernel(values, target_format, convert)
+
+                self.assertEqual(values, expected)
+                self.assertEqual(changed, sum(map(lambda a, b: a != b, expected, self.values)))
+
+
+if __name__ == "__main__":
+    unittest.main()